@@ -8,6 +8,8 @@ import sys
 import argparse
 from pathlib import Path
 
+import PIL
+
 # Add src directory to Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
@@ -65,6 +67,7 @@ Features Enabled:
   
 System Information:
   • Python: {sys.version.split()[0]}
+  • Pillow: {PIL.__version__}
   • Platform: {sys.platform}
   • Working Directory: {os.getcwd()}
   • Settings Directory: {get_settings_manager().config_dir}
@@ -108,6 +111,9 @@ def setup_logging():
             
         except Exception as e:
             print(f"Warning: Could not setup file logging: {e}")
+    
+    # Pillow-SIMD builds report a ".postN" version, so this shows which one resizes
+    logger.debug(f"Pillow {PIL.__version__}")
 
 
 def initialize_application():
@@ -11,6 +11,7 @@ from typing import List
 import sys
 from src.services.image_handler import ImageHandler
 from src.services.pdf_converter import PDFConverter
+from src.settings_manager import get_settings_manager
 
 
 def progress_callback(progress: float) -> None:
@@ -116,7 +117,7 @@ def main():
     
     try:
         # Convert images to PDF
-        converter = PDFConverter()
+        converter = PDFConverter(cache_dir=str(get_settings_manager().get_cache_directory()))
         output_path = converter.convert_images_to_pdf(
             image_paths=image_paths,
             output_path=args.output,
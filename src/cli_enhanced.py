@@ -9,6 +9,7 @@ import time
 from typing import List, Optional
 from src.services.image_handler import ImageHandler
 from src.services.pdf_converter import PDFConverter
+from src.settings_manager import get_settings_manager
 from src.services.advanced_processor import AdvancedImageProcessor
 
 
@@ -305,7 +306,7 @@ def main():
         
         start_time = time.time()
         
-        converter = PDFConverter()
+        converter = PDFConverter(cache_dir=str(get_settings_manager().get_cache_directory()))
         
         # Create progress callback
         progress_callback = None
@@ -14,6 +14,7 @@ from PIL import Image, ImageTk
 import sys
 from src.services.image_handler import ImageHandler
 from src.services.pdf_converter import PDFConverter
+from src.settings_manager import get_settings_manager
 
 
 class ImageToPdfGUI:
@@ -423,7 +424,7 @@ class ImageToPdfGUI:
         # Run the conversion in a separate thread to keep UI responsive
         def export_thread() -> None:
             try:
-                converter = PDFConverter()
+                converter = PDFConverter(cache_dir=str(get_settings_manager().get_cache_directory()))
                 converter.convert_images_to_pdf(
                     image_paths=self.image_paths,
                     output_path=output_path,
@@ -28,6 +28,7 @@ from PyQt5.QtGui import (
 from PIL import Image, ImageQt
 from src.services.image_handler import ImageHandler
 from src.services.pdf_converter import PDFConverter
+from src.settings_manager import get_settings_manager
 
 
 class DarkTheme:
@@ -426,7 +427,7 @@ class ConversionThread(QThread):
     def run(self):
         """Run the conversion in a separate thread."""
         try:
-            converter = PDFConverter()
+            converter = PDFConverter(cache_dir=str(get_settings_manager().get_cache_directory()))
             
             def progress_callback(progress: float):
                 self.progress_updated.emit(progress)
@@ -898,7 +899,7 @@ class AdvancedImageToPdfGUI(QMainWindow):
     def drop_event(self, event: QDropEvent):
         """Handle drop events."""
         files = [url.toLocalFile() for url in event.mimeData().urls()]
-        valid_files = [f for f in files if ImageHandler.is_valid_image(f)]
+        valid_files = ImageHandler.filter_valid_images(files)
         
         if valid_files:
             self.add_images_from_paths(valid_files)
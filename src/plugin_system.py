@@ -7,7 +7,8 @@ import sys
 import importlib
 import inspect
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Optional, Callable, Type
+from typing import Dict, List, Any, Optional, Callable, Type, Tuple, Mapping
+from types import MappingProxyType
 from pathlib import Path
 import json
 
@@ -171,7 +172,15 @@ class PluginManager:
         self.plugins: Dict[str, PluginInterface] = {}
         self.plugin_metadata: Dict[str, PluginMetadata] = {}
         self.plugin_directories = plugin_directories or []
-        self.hooks: Dict[str, List[Callable]] = {}
+        # Hook callbacks; only mutate through register_hook/unregister_hook so
+        # the prebuilt dispatchers stay in sync
+        self._hooks: Dict[str, List[Callable]] = {}
+        # Prebuilt dispatchers per hook, rebuilt whenever its callbacks change
+        self._hook_dispatch: Dict[str, Callable[..., List[Any]]] = {}
+        # Parsed manifests keyed by path, stored with the mtime they were read at
+        self._manifest_cache: Dict[str, Tuple[int, PluginMetadata]] = {}
+        # Resolved plugin classes keyed by (main_module, plugin_class)
+        self._class_cache: Dict[Tuple[str, str], Type[PluginInterface]] = {}
         
         # Add default plugin directory
         default_plugin_dir = os.path.join(os.path.dirname(__file__), '..', 'plugins')
@@ -188,25 +197,50 @@ class PluginManager:
         discovered = []
         
         for directory in self.plugin_directories:
-            if not os.path.exists(directory):
+            try:
+                it = os.scandir(directory)
+            except (FileNotFoundError, NotADirectoryError):
                 continue
             
-            for item in os.listdir(directory):
-                plugin_path = os.path.join(directory, item)
-                if not os.path.isdir(plugin_path):
-                    continue
-                
-                manifest_path = os.path.join(plugin_path, 'manifest.json')
-                if os.path.exists(manifest_path):
+            with it:
+                for entry in it:
+                    # Uses the file type from the directory listing, no stat needed
+                    if not entry.is_dir():
+                        continue
+                    
+                    manifest_path = os.path.join(entry.path, 'manifest.json')
                     try:
-                        metadata = PluginMetadata(manifest_path)
-                        discovered.append(metadata)
-                        self.plugin_metadata[metadata.name] = metadata
+                        metadata = self._load_metadata(manifest_path)
+                    except FileNotFoundError:
+                        continue
                     except Exception as e:
                         print(f"Error loading plugin manifest {manifest_path}: {e}")
+                        continue
+                    
+                    discovered.append(metadata)
+                    self.plugin_metadata[metadata.name] = metadata
         
         return discovered
     
+    def _load_metadata(self, manifest_path: str) -> PluginMetadata:
+        """
+        Load plugin metadata, reusing the parsed manifest if it is unchanged.
+        
+        Args:
+            manifest_path: Path to plugin manifest file
+            
+        Returns:
+            PluginMetadata: Metadata for the manifest
+        """
+        mtime = os.stat(manifest_path).st_mtime_ns
+        cached = self._manifest_cache.get(manifest_path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        
+        metadata = PluginMetadata(manifest_path)
+        self._manifest_cache[manifest_path] = (mtime, metadata)
+        return metadata
+    
     def load_plugin(self, plugin_name: str) -> bool:
         """
         Load a specific plugin.
@@ -236,15 +270,7 @@ class PluginManager:
             if metadata.plugin_dir not in sys.path:
                 sys.path.insert(0, metadata.plugin_dir)
             
-            # Import the plugin module
-            module = importlib.import_module(metadata.main_module)
-            
-            # Get the plugin class
-            plugin_class = getattr(module, metadata.plugin_class)
-            
-            # Verify it implements the correct interface
-            if not issubclass(plugin_class, PluginInterface):
-                raise ValueError(f"Plugin class must inherit from PluginInterface")
+            plugin_class = self._resolve_plugin_class(metadata)
             
             # Create plugin instance
             plugin_instance = plugin_class()
@@ -263,6 +289,36 @@ class PluginManager:
             print(f"Error loading plugin {plugin_name}: {e}")
             return False
     
+    def _resolve_plugin_class(self, metadata: PluginMetadata) -> Type[PluginInterface]:
+        """
+        Resolve the plugin class for a manifest, importing its module at most once.
+        
+        Args:
+            metadata: Metadata of the plugin to resolve
+            
+        Returns:
+            Type[PluginInterface]: The plugin class
+        """
+        key = (metadata.main_module, metadata.plugin_class)
+        plugin_class = self._class_cache.get(key)
+        if plugin_class is not None:
+            return plugin_class
+        
+        # Reuse an already imported module instead of going through the import system
+        module = sys.modules.get(metadata.main_module)
+        if module is None:
+            module = importlib.import_module(metadata.main_module)
+        
+        # Get the plugin class
+        plugin_class = getattr(module, metadata.plugin_class)
+        
+        # Verify it implements the correct interface
+        if not issubclass(plugin_class, PluginInterface):
+            raise ValueError(f"Plugin class must inherit from PluginInterface")
+        
+        self._class_cache[key] = plugin_class
+        return plugin_class
+    
     def unload_plugin(self, plugin_name: str) -> bool:
         """
         Unload a specific plugin.
@@ -347,6 +403,12 @@ class PluginManager:
         return [plugin for plugin in self.plugins.values() 
                 if isinstance(plugin, plugin_type)]
     
+    @property
+    def hooks(self) -> Mapping[str, Tuple[Callable, ...]]:
+        """Read-only view of the registered hook callbacks."""
+        return MappingProxyType({name: tuple(callbacks)
+                                 for name, callbacks in self._hooks.items()})
+    
     def register_hook(self, hook_name: str, callback: Callable) -> bool:
         """
         Register a hook callback.
@@ -358,11 +420,12 @@ class PluginManager:
         Returns:
             bool: True if registered successfully
         """
-        if hook_name not in self.hooks:
-            self.hooks[hook_name] = []
+        if hook_name not in self._hooks:
+            self._hooks[hook_name] = []
         
-        if callback not in self.hooks[hook_name]:
-            self.hooks[hook_name].append(callback)
+        if callback not in self._hooks[hook_name]:
+            self._hooks[hook_name].append(callback)
+            self._rebuild_hook_dispatch(hook_name)
             return True
         
         return False
@@ -378,8 +441,9 @@ class PluginManager:
         Returns:
             bool: True if unregistered successfully
         """
-        if hook_name in self.hooks and callback in self.hooks[hook_name]:
-            self.hooks[hook_name].remove(callback)
+        if hook_name in self._hooks and callback in self._hooks[hook_name]:
+            self._hooks[hook_name].remove(callback)
+            self._rebuild_hook_dispatch(hook_name)
             return True
         
         return False
@@ -396,17 +460,34 @@ class PluginManager:
         Returns:
             List[Any]: List of results from callbacks
         """
-        results = []
+        dispatch = self._hook_dispatch.get(hook_name)
+        if dispatch is None:
+            return []
+        return dispatch(*args, **kwargs)
+    
+    def _rebuild_hook_dispatch(self, hook_name: str):
+        """
+        Rebuild the dispatcher for a hook from its current callbacks.
         
-        if hook_name in self.hooks:
-            for callback in self.hooks[hook_name]:
+        Args:
+            hook_name: Name of the hook
+        """
+        callbacks = tuple(self._hooks.get(hook_name, ()))
+        if not callbacks:
+            self._hook_dispatch.pop(hook_name, None)
+            return
+        
+        def dispatch(*args, **kwargs) -> List[Any]:
+            results = []
+            append = results.append
+            for callback in callbacks:
                 try:
-                    result = callback(*args, **kwargs)
-                    results.append(result)
+                    append(callback(*args, **kwargs))
                 except Exception as e:
                     print(f"Error executing hook {hook_name}: {e}")
+            return results
         
-        return results
+        self._hook_dispatch[hook_name] = dispatch
     
     def get_plugin_info(self) -> List[Dict[str, Any]]:
         """
@@ -6,19 +6,104 @@ image processing capabilities like rotation, watermarking, and optimization.
 """
 
 import os
+import shutil
 import tempfile
-from PIL import Image, ImageDraw, ImageFont, ImageEnhance
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from PIL import Image
 from typing import List, Tuple, Optional, Union
 import logging
 
+from ._imaging import flatten_on_white
+
+
+# Extensions (without the dot) picked up by batch_process_folder
+_IMAGE_EXTS = frozenset({'jpg', 'jpeg', 'png', 'bmp', 'tiff', 'tif', 'gif', 'webp'})
+
+
+@lru_cache(maxsize=32)
+def _get_font(name: str, size: int):
+    """Load a TrueType font once per (name, size), falling back to the default font."""
+    from PIL import ImageFont
+    
+    try:
+        return ImageFont.truetype(name, size)
+    except (OSError, IOError):
+        return ImageFont.load_default()
+
+
+@lru_cache(maxsize=128)
+def _measure_text(text: str, font_name: str, font_size: int) -> Tuple[int, int, int, int]:
+    """Return the bounding box of text rendered at the origin with the given font."""
+    from PIL import ImageDraw
+    
+    draw = ImageDraw.Draw(Image.new('RGBA', (1, 1)))
+    return draw.textbbox((0, 0), text, font=_get_font(font_name, font_size))
+
+
+@lru_cache(maxsize=None)
+def _get_turbojpeg():
+    """Return a shared TurboJPEG codec, or None if libjpeg-turbo is unavailable."""
+    try:
+        from turbojpeg import TurboJPEG
+        return TurboJPEG()
+    except (ImportError, OSError, RuntimeError):
+        return None
+
+
+def _decode_thumbnail(image_path: str, size: Tuple[int, int]) -> Tuple[bytes, int, int]:
+    """
+    Decode an image and shrink it to a thumbnail.
+    
+    Runs in a worker process, so the pixels are returned as raw RGB bytes.
+    
+    Args:
+        image_path: Path to the image
+        size: Maximum thumbnail size
+        
+    Returns:
+        Tuple[bytes, int, int]: RGB pixel data, width and height
+    """
+    with Image.open(image_path) as img:
+        if img.format == 'JPEG':
+            img.draft('RGB', size)
+        img.thumbnail(size, Image.Resampling.LANCZOS)
+        img = img.convert('RGB')
+        return img.tobytes(), img.width, img.height
+
 
 class AdvancedImageProcessor:
-    """Advanced image processing with additional features."""
+    """
+    Advanced image processing with additional features.
+    
+    Outputs written to the temporary directory (such as the default thumbnail
+    grid) stay on disk until close() is called or a ``with`` block exits.
+    """
     
     def __init__(self):
         """Initialize the advanced image processor."""
-        self.temp_dir = tempfile.mkdtemp()
+        self._temp_dir: Optional[str] = None
         self.logger = logging.getLogger(__name__)
+        self._grid_canvas = None
+    
+    @property
+    def temp_dir(self) -> str:
+        """Temporary working directory, created on first use."""
+        if self._temp_dir is None:
+            self._temp_dir = tempfile.mkdtemp(prefix='img_org_')
+        return self._temp_dir
+    
+    def close(self):
+        """Remove the temporary directory, including any outputs written to it."""
+        if self._temp_dir:
+            shutil.rmtree(self._temp_dir, ignore_errors=True)
+            self._temp_dir = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
     
     def auto_rotate_image(self, image_path: str, output_path: Optional[str] = None) -> str:
         """
@@ -31,23 +116,16 @@ class AdvancedImageProcessor:
         Returns:
             str: Path to processed image
         """
+        from PIL import ImageOps
+        
         if output_path is None:
             name, ext = os.path.splitext(image_path)
             output_path = f"{name}_rotated{ext}"
         
         try:
             with Image.open(image_path) as img:
-                # Check for EXIF orientation
-                exif = img._getexif() if hasattr(img, '_getexif') else None
-                if exif:
-                    orientation = exif.get(0x0112)  # Orientation tag
-                    if orientation == 3:
-                        img = img.rotate(180, expand=True)
-                    elif orientation == 6:
-                        img = img.rotate(270, expand=True)
-                    elif orientation == 8:
-                        img = img.rotate(90, expand=True)
-                
+                # Apply all eight EXIF orientations with lossless transposes
+                img = ImageOps.exif_transpose(img)
                 img.save(output_path)
                 return output_path
                 
@@ -55,7 +133,6 @@ class AdvancedImageProcessor:
             self.logger.warning(f"Auto-rotation failed for {image_path}: {e}")
             # If rotation fails, just copy the original
             if output_path != image_path:
-                import shutil
                 shutil.copy2(image_path, output_path)
             return output_path
     
@@ -76,27 +153,26 @@ class AdvancedImageProcessor:
         Returns:
             str: Path to watermarked image
         """
+        from PIL import ImageDraw
+        
         if output_path is None:
             name, ext = os.path.splitext(image_path)
             output_path = f"{name}_watermarked{ext}"
         
         with Image.open(image_path) as img:
-            # Convert to RGBA to support transparency
-            if img.mode != 'RGBA':
-                img = img.convert('RGBA')
-            
-            # Create a transparent overlay
-            overlay = Image.new('RGBA', img.size, (255, 255, 255, 0))
-            draw = ImageDraw.Draw(overlay)
+            # Flatten to RGB on white first; the watermark is composited afterwards
+            if img.mode in ('RGBA', 'LA', 'PA') or 'transparency' in img.info:
+                rgba = img.convert('RGBA')
+                img = Image.new('RGB', rgba.size, (255, 255, 255))
+                img.paste(rgba, mask=rgba.getchannel('A'))
+            elif img.mode != 'RGB':
+                img = img.convert('RGB')
             
             # Try to use a good font, fallback to default
-            try:
-                font = ImageFont.truetype("arial.ttf", font_size)
-            except (OSError, IOError):
-                font = ImageFont.load_default()
+            font = _get_font("arial.ttf", font_size)
             
             # Get text size
-            bbox = draw.textbbox((0, 0), watermark_text, font=font)
+            bbox = _measure_text(watermark_text, "arial.ttf", font_size)
             text_width = bbox[2] - bbox[0]
             text_height = bbox[3] - bbox[1]
             
@@ -117,20 +193,21 @@ class AdvancedImageProcessor:
             else:
                 x, y = img_width - text_width - margin, img_height - text_height - margin
             
-            # Draw text with semi-transparency
             alpha = int(255 * opacity)
-            draw.text((x, y), watermark_text, font=font, fill=(255, 255, 255, alpha))
-            
-            # Composite the overlay onto the original image
-            watermarked = Image.alpha_composite(img, overlay)
-            
-            # Convert back to RGB if needed
-            if watermarked.mode == 'RGBA':
-                background = Image.new('RGB', watermarked.size, (255, 255, 255))
-                background.paste(watermarked, mask=watermarked.split()[3])
-                watermarked = background
+            if alpha >= 255:
+                # Fully opaque text needs no overlay, draw it straight onto the image
+                ImageDraw.Draw(img).text((x, y), watermark_text, font=font,
+                                         fill=(255, 255, 255))
+            elif text_width > 0 and text_height > 0:
+                # Draw text with semi-transparency on an overlay covering only the text
+                overlay = Image.new('RGBA', (text_width, text_height), (255, 255, 255, 0))
+                ImageDraw.Draw(overlay).text((-bbox[0], -bbox[1]), watermark_text,
+                                             font=font, fill=(255, 255, 255, alpha))
+                
+                # Blend the overlay into the text region only
+                img.paste(overlay, (x + bbox[0], y + bbox[1]), overlay)
             
-            watermarked.save(output_path)
+            img.save(output_path)
             return output_path
     
     def enhance_image(self, image_path: str, brightness: float = 1.0,
@@ -150,6 +227,8 @@ class AdvancedImageProcessor:
         Returns:
             str: Path to enhanced image
         """
+        from PIL import ImageEnhance
+        
         if output_path is None:
             name, ext = os.path.splitext(image_path)
             output_path = f"{name}_enhanced{ext}"
@@ -185,46 +264,56 @@ class AdvancedImageProcessor:
             image_paths: List of image file paths
             grid_size: Grid dimensions (cols, rows)
             thumbnail_size: Size of each thumbnail
-            output_path: Path to save grid image
+            output_path: Path to save grid image (defaults to the temporary
+                directory, which is removed by close())
             
         Returns:
             str: Path to grid image
         """
+        import numpy as np
+        
         if output_path is None:
             output_path = os.path.join(self.temp_dir, "thumbnail_grid.jpg")
         
         cols, rows = grid_size
         thumb_width, thumb_height = thumbnail_size
         
-        # Create blank canvas
-        canvas_width = cols * thumb_width
-        canvas_height = rows * thumb_height
-        canvas = Image.new('RGB', (canvas_width, canvas_height), 'white')
+        # Create blank canvas, reusing the previous buffer when the grid size matches
+        canvas_shape = (rows * thumb_height, cols * thumb_width, 3)
+        canvas = self._grid_canvas
+        if canvas is not None and canvas.shape == canvas_shape:
+            canvas.fill(255)
+        else:
+            canvas = np.full(canvas_shape, 255, dtype=np.uint8)
+            self._grid_canvas = canvas
         
-        # Place thumbnails
-        for i, image_path in enumerate(image_paths[:cols * rows]):
-            if not os.path.exists(image_path):
-                continue
-                
-            row = i // cols
-            col = i % cols
+        # Decode and resample thumbnails in worker processes
+        jobs = [(i, image_path) for i, image_path in enumerate(image_paths[:cols * rows])
+                if os.path.exists(image_path)]
+        
+        with ProcessPoolExecutor() as executor:
+            futures = [executor.submit(_decode_thumbnail, image_path, thumbnail_size)
+                       for _, image_path in jobs]
             
-            try:
-                with Image.open(image_path) as img:
-                    # Create thumbnail
-                    img.thumbnail(thumbnail_size, Image.Resampling.LANCZOS)
-                    
-                    # Center the thumbnail in the allocated space
-                    x = col * thumb_width + (thumb_width - img.width) // 2
-                    y = row * thumb_height + (thumb_height - img.height) // 2
-                    
-                    canvas.paste(img, (x, y))
-                    
-            except Exception as e:
-                self.logger.warning(f"Failed to process {image_path}: {e}")
-                continue
+            # Place thumbnails
+            for (i, image_path), future in zip(jobs, futures):
+                try:
+                    buffer, width, height = future.result()
+                except Exception as e:
+                    self.logger.warning(f"Failed to process {image_path}: {e}")
+                    continue
+                
+                row = i // cols
+                col = i % cols
+                
+                # Center the thumbnail in the allocated space
+                x = col * thumb_width + (thumb_width - width) // 2
+                y = row * thumb_height + (thumb_height - height) // 2
+                
+                thumb = np.frombuffer(buffer, dtype=np.uint8).reshape(height, width, 3)
+                canvas[y:y + height, x:x + width] = thumb
         
-        canvas.save(output_path)
+        Image.fromarray(canvas).save(output_path)
         return output_path
     
     def optimize_for_pdf(self, image_path: str, max_width: int = 2000,
@@ -247,18 +336,26 @@ class AdvancedImageProcessor:
             name, ext = os.path.splitext(image_path)
             output_path = f"{name}_optimized.jpg"
         
+        # Decode JPEG sources with libjpeg-turbo directly when it is installed
+        if image_path.lower().endswith(('.jpg', '.jpeg')):
+            jpeg = _get_turbojpeg()
+            if jpeg is not None:
+                try:
+                    return self._optimize_jpeg_turbo(jpeg, image_path, max_width,
+                                                     max_height, quality, output_path)
+                except Exception as e:
+                    self.logger.debug(f"TurboJPEG optimization failed for {image_path}, "
+                                      f"falling back to Pillow: {e}")
+        
         with Image.open(image_path) as img:
+            # Let libjpeg decode large JPEGs at a reduced DCT scale
+            if img.format == 'JPEG':
+                img.draft('RGB', (max_width * 2, max_height * 2))
+            
             # Convert to RGB if necessary
             if img.mode in ('RGBA', 'LA', 'P'):
-                # Create white background
-                background = Image.new('RGB', img.size, 'white')
-                if img.mode == 'P':
-                    img = img.convert('RGBA')
-                if 'transparency' in img.info:
-                    background.paste(img, mask=img.split()[-1])
-                else:
-                    background.paste(img)
-                img = background
+                # Blend onto a white background using the alpha channel
+                img = flatten_on_white(img.convert('RGBA'))
             elif img.mode != 'RGB':
                 img = img.convert('RGB')
             
@@ -270,6 +367,50 @@ class AdvancedImageProcessor:
             img.save(output_path, 'JPEG', quality=quality, optimize=True)
             return output_path
     
+    def _optimize_jpeg_turbo(self, jpeg, image_path: str, max_width: int,
+                             max_height: int, quality: int, output_path: str) -> str:
+        """
+        JPEG variant of optimize_for_pdf that decodes with libjpeg-turbo.
+        
+        The image is decoded at the same reduced DCT scale Image.draft() would
+        pick and encoded with the same settings as the Pillow path, so the output
+        does not depend on whether libjpeg-turbo is installed.
+        
+        Args:
+            jpeg: TurboJPEG codec instance
+            image_path: Path to input JPEG
+            max_width: Maximum width in pixels
+            max_height: Maximum height in pixels
+            quality: JPEG quality (1-100)
+            output_path: Path to save optimized image
+            
+        Returns:
+            str: Path to optimized image
+        """
+        from turbojpeg import TJPF_RGB
+        
+        with open(image_path, 'rb') as f:
+            data = f.read()
+        
+        # Pick the largest IDCT reduction that keeps 2x headroom over the target
+        width, height = jpeg.decode_header(data)[:2]
+        scale = min(width // (max_width * 2), height // (max_height * 2))
+        scaling_factor = None
+        for denominator in (8, 4, 2):
+            if scale >= denominator and (1, denominator) in jpeg.scaling_factors:
+                scaling_factor = (1, denominator)
+                break
+        
+        img = Image.fromarray(jpeg.decode(data, pixel_format=TJPF_RGB,
+                                          scaling_factor=scaling_factor))
+        
+        # Resize if too large
+        if img.width > max_width or img.height > max_height:
+            img.thumbnail((max_width, max_height), Image.Resampling.LANCZOS)
+        
+        img.save(output_path, 'JPEG', quality=quality, optimize=True)
+        return output_path
+    
     def batch_process_folder(self, input_folder: str, output_folder: str,
                            operations: List[str] = None) -> List[str]:
         """
@@ -291,14 +432,17 @@ class AdvancedImageProcessor:
         
         processed_files = []
         
-        # Supported image extensions
-        image_extensions = {'.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.gif'}
+        # scandir exposes cached file type info, avoiding a stat per entry
+        entries = []
+        with os.scandir(input_folder) as it:
+            for entry in it:
+                _, dot, ext = entry.name.rpartition('.')
+                if dot and ext.lower() in _IMAGE_EXTS and entry.is_file():
+                    entries.append(entry)
         
-        for filename in os.listdir(input_folder):
-            if os.path.splitext(filename.lower())[1] not in image_extensions:
-                continue
-                
-            input_path = os.path.join(input_folder, filename)
+        for entry in entries:
+            filename = entry.name
+            input_path = entry.path
             output_path = os.path.join(output_folder, filename)
             
             current_path = input_path
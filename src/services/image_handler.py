@@ -6,14 +6,50 @@ and processing images before they are converted to PDF.
 """
 
 import os
+import shutil
+import tempfile
+from contextlib import contextmanager
 from PIL import Image
-from typing import List, Tuple, Optional
+from typing import Iterator, List, Tuple, Optional, Union
+
+from ._imaging import flatten_on_white
+
+
+@contextmanager
+def _save_target(file_path: str, output_path: str) -> Iterator[str]:
+    """
+    Yield the path an operation on file_path should save to.
+
+    Overwrites of the source go to a temporary sibling file that replaces the
+    original on success, so a failed save never leaves it truncated.
+
+    Args:
+        file_path: Path to the source image
+        output_path: Path the result should end up at
+
+    Yields:
+        str: Path to save the result to
+    """
+    if os.path.abspath(output_path) != os.path.abspath(file_path):
+        yield output_path
+        return
+
+    fd, temp_path = tempfile.mkstemp(suffix=os.path.splitext(output_path)[1],
+                                     dir=os.path.dirname(os.path.abspath(output_path)))
+    os.close(fd)
+    try:
+        yield temp_path
+        shutil.copymode(file_path, temp_path)
+        os.replace(temp_path, output_path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
 
 
 class ImageHandler:
     """Class for handling image operations."""
 
-    SUPPORTED_FORMATS = ['.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.gif']
+    SUPPORTED_FORMATS = frozenset({'.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.gif'})
 
     @staticmethod
     def is_valid_image(file_path: str) -> bool:
@@ -26,8 +62,35 @@ class ImageHandler:
         Returns:
             bool: True if the file is a valid image, False otherwise
         """
-        ext = os.path.splitext(file_path)[1].lower()
-        return ext in ImageHandler.SUPPORTED_FORMATS
+        # Plain string split instead of splitext; a dot in a directory name
+        # leaves a separator in ext, which never matches
+        _, dot, ext = file_path.rpartition('.')
+        return bool(dot) and '.' + ext.lower() in ImageHandler.SUPPORTED_FORMATS
+
+    @staticmethod
+    def filter_valid_images(paths: Union[str, List[str]]) -> List[str]:
+        """
+        Keep only the paths with a supported image format.
+
+        Args:
+            paths: List of file paths, or a directory whose files are scanned
+
+        Returns:
+            List[str]: Supported image paths (a directory's are sorted by name)
+        """
+        exts = ImageHandler.SUPPORTED_FORMATS
+
+        if isinstance(paths, str):
+            # Filter on entry.name and only build full paths for the matches
+            with os.scandir(paths) as entries:
+                names = sorted(
+                    entry.name for entry in entries
+                    if entry.name[entry.name.rfind('.'):].lower() in exts
+                    and entry.is_file()
+                )
+            return [os.path.join(paths, name) for name in names]
+
+        return [p for p in paths if ImageHandler.is_valid_image(p)]
 
     @staticmethod
     def get_image_dimensions(file_path: str) -> Tuple[int, int]:
@@ -61,21 +124,35 @@ class ImageHandler:
             output_path = file_path
 
         with Image.open(file_path) as img:
-            img = img.resize(size, Image.Resampling.LANCZOS)
-            img.save(output_path)
+            needs_resize = img.size != tuple(size)
+
+        if not needs_resize and os.path.abspath(output_path) == os.path.abspath(file_path):
+            # Already the requested size, so skip the decode/encode round trip
+            return output_path
+
+        # The source is closed before an in-place result replaces it
+        with _save_target(file_path, output_path) as save_path:
+            with Image.open(file_path) as img:
+                if needs_resize:
+                    img = img.resize(size, Image.Resampling.LANCZOS)
+                img.save(save_path)
 
         return output_path
 
     @staticmethod
     def compress_image(file_path: str, quality: int = 85, 
-                       output_path: Optional[str] = None) -> str:
+                       output_path: Optional[str] = None,
+                       subsampling: int = 2) -> str:
         """
         Compress an image by reducing its quality.
 
+        JPEG output is progressive, which is usually smaller than baseline.
+
         Args:
             file_path: Path to the image file
             quality: Quality level (1-100, lower means more compression)
             output_path: Path to save the compressed image (if None, overwrites original)
+            subsampling: JPEG chroma subsampling (0 = 4:4:4, 1 = 4:2:2, 2 = 4:2:0)
 
         Returns:
             str: Path to the compressed image
@@ -84,17 +161,19 @@ class ImageHandler:
             output_path = file_path
 
         ext = os.path.splitext(file_path)[1].lower()
+        save_params = {'quality': quality, 'optimize': True,
+                       'subsampling': subsampling, 'progressive': True}
         
         # For PNG, we need to convert to RGB if it has transparency
-        with Image.open(file_path) as img:
-            if ext == '.png' and img.mode == 'RGBA':
-                # Create a white background
-                background = Image.new('RGB', img.size, (255, 255, 255))
-                background.paste(img, mask=img.split()[3])  # 3 is the alpha channel
-                background.save(output_path, quality=quality, optimize=True)
-            else:
-                if img.mode != 'RGB':
-                    img = img.convert('RGB')
-                img.save(output_path, quality=quality, optimize=True)
+        with _save_target(file_path, output_path) as save_path:
+            with Image.open(file_path) as img:
+                if ext == '.png' and img.mode == 'RGBA':
+                    # Flatten onto a white background
+                    background = flatten_on_white(img)
+                    background.save(save_path, **save_params)
+                else:
+                    if img.mode != 'RGB':
+                        img = img.convert('RGB')
+                    img.save(save_path, **save_params)
 
         return output_path
@@ -6,11 +6,97 @@ various options for page size, compression, and layout.
 """
 
 import os
+import hashlib
 import img2pdf
 from PIL import Image
 from typing import List, Tuple, Literal, Optional
 import tempfile
 import shutil
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from ._imaging import flatten_on_white
+
+# Millimetres per PDF point (1/72 inch)
+_MM_PER_POINT = 0.352778
+
+# img2pdf layout functions, built once per page size
+_LAYOUT_CACHE = {}
+
+# EXIF tag holding the camera orientation
+_EXIF_ORIENTATION = 0x0112
+
+
+def _prepare_one(job: Tuple[str, str, Optional[Tuple[int, int]], bool, int]) -> str:
+    """
+    Prepare a single image for PDF conversion.
+    
+    Runs in a worker process, so it takes a single picklable argument tuple.
+    
+    Args:
+        job: Tuple of (image path, path to write the prepared copy to, target
+            page size in points or None to keep the original size, compress,
+            compression quality)
+        
+    Returns:
+        str: Path to the prepared image, or the original path if it can be
+            embedded unchanged
+    """
+    img_path, temp_path, target_size, compress, compression_quality = job
+    
+    # Written under a partial name first so a cached copy is never truncated
+    root, file_ext = os.path.splitext(temp_path)
+    partial_path = f"{root}.partial{file_ext}"
+    
+    with Image.open(img_path) as img:
+        # img2pdf embeds these as-is, so there is nothing to prepare. An EXIF
+        # orientation would be applied (or rejected, for invalid values like
+        # 0) by img2pdf but dropped by the re-encode below, so those images
+        # take the re-encode path like every other page size does
+        if (target_size is None and not compress
+                and img.mode == 'RGB' and img.format in ('JPEG', 'PNG')
+                and img.getexif().get(_EXIF_ORIENTATION) in (None, 1)):
+            return img_path
+        
+        # Work out the target dimensions if a specific page size is requested
+        new_size = None
+        if target_size is not None:
+            pdf_width, pdf_height = target_size
+            img_width, img_height = img.size
+            
+            # Calculate aspect ratios
+            page_ratio = pdf_width / pdf_height
+            img_ratio = img_width / img_height
+            
+            # Resize to fit within page while maintaining aspect ratio
+            if img_ratio > page_ratio:  # Image is wider
+                new_size = (pdf_width, int(pdf_width / img_ratio))
+            else:  # Image is taller
+                new_size = (int(pdf_height * img_ratio), pdf_height)
+            
+            # Let libjpeg decode at a reduced DCT scale, straight to RGB
+            if img.format == 'JPEG':
+                img.draft('RGB', new_size)
+        
+        # Convert to RGB if necessary (PDF doesn't support RGBA)
+        if img.mode == 'RGBA':
+            img = flatten_on_white(img)
+        elif img.mode != 'RGB':
+            img = img.convert('RGB')
+        
+        if new_size is not None:
+            img = img.resize(new_size, Image.Resampling.LANCZOS)
+        
+        # Compress if requested
+        if compress:
+            # 4:2:0 chroma, pinned rather than left to the encoder's default.
+            # No optimize pass: its second Huffman pass roughly doubles encode
+            # time and only trims a few percent off an intermediate file
+            img.save(partial_path, quality=compression_quality, subsampling=2)
+        else:
+            img.save(partial_path)
+    
+    os.replace(partial_path, temp_path)
+    return temp_path
 
 
 class PDFConverter:
@@ -24,9 +110,27 @@ class PDFConverter:
         'TABLOID': (792, 1224)  # 11 x 17 inches
     }
     
-    def __init__(self):
-        """Initialize the PDF converter."""
+    PAGE_SIZES_MM = {name: (width * _MM_PER_POINT, height * _MM_PER_POINT)
+                     for name, (width, height) in PAGE_SIZES.items()}
+    
+    # Size the cache directory is trimmed back to after each conversion,
+    # dropping the least recently used prepared images first
+    CACHE_MAX_BYTES = 512 * 1024 * 1024
+    
+    def __init__(self, cache_dir: Optional[str] = None):
+        """
+        Initialize the PDF converter.
+        
+        Args:
+            cache_dir: Optional directory for keeping prepared images between
+                conversions and converter instances, trimmed to
+                CACHE_MAX_BYTES after each conversion. Without it, prepared
+                images live in a temporary directory removed with the converter.
+        """
         self.temp_dir = tempfile.mkdtemp()
+        self.cache_dir = cache_dir
+        if cache_dir is not None:
+            os.makedirs(cache_dir, exist_ok=True)
     
     def __del__(self):
         """Clean up temporary files."""
@@ -35,64 +139,94 @@ class PDFConverter:
         except (OSError, AttributeError):
             pass
     
+    def _prepared_path(self, index: int, img_path: str,
+                       target_size: Optional[Tuple[int, int]],
+                       compress: bool, compression_quality: int) -> str:
+        """
+        Work out where the prepared copy of an image is written.
+        
+        In the cache directory the name is a hash of the source file's
+        identity and the preparation options, so a changed file or option
+        never matches a stale copy.
+        
+        Args:
+            index: Position of the image in the conversion
+            img_path: Path to the source image
+            target_size: Target page size in points, or None for the original size
+            compress: Whether the image is compressed
+            compression_quality: Image quality for compression (1-100)
+            
+        Returns:
+            str: Path for the prepared image
+        """
+        file_ext = os.path.splitext(img_path)[1]
+        if self.cache_dir is None:
+            return os.path.join(self.temp_dir, f"image_{index}{file_ext}")
+        
+        stat = os.stat(img_path)
+        key = (f"{os.path.abspath(img_path)}|{stat.st_mtime_ns}|{stat.st_size}|"
+               f"{target_size}|{compress}|{compression_quality if compress else ''}")
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}{file_ext}")
+    
     def _prepare_images(self, image_paths: List[str], 
                        page_size: str, 
                        compress: bool = False,
-                       compression_quality: int = 85) -> List[str]:
+                       compression_quality: int = 85,
+                       callback=None) -> List[str]:
         """
         Prepare images for PDF conversion.
         
+        Images are prepared in parallel worker processes; copies already in
+        the cache directory are reused without being decoded again.
+        
         Args:
             image_paths: List of paths to images
             page_size: Target page size ('A4', 'LETTER', etc., or 'FIT' for original size)
             compress: Whether to compress images
             compression_quality: Image quality for compression (1-100)
+            callback: Optional callback receiving the overall progress (0-1) as
+                images finish, at most once per percent; the final step is
+                left for writing the PDF
             
         Returns:
             List[str]: List of paths to prepared images
         """
-        prepared_paths = []
-        
+        target_size = self.PAGE_SIZES.get(page_size) if page_size != 'FIT' else None
+        prepared_paths = list(image_paths)
+        jobs = {}
         for i, img_path in enumerate(image_paths):
-            # Create a copy of the image in the temp directory
-            file_ext = os.path.splitext(img_path)[1]
-            temp_path = os.path.join(self.temp_dir, f"image_{i}{file_ext}")
+            temp_path = self._prepared_path(i, img_path, target_size,
+                                            compress, compression_quality)
+            if self.cache_dir is not None and os.path.exists(temp_path):
+                # Mark the copy as recently used so trimming keeps it
+                os.utime(temp_path)
+                prepared_paths[i] = temp_path
+            else:
+                jobs[i] = (img_path, temp_path, target_size, compress, compression_quality)
+        
+        if not jobs:
+            return prepared_paths
+        
+        total_steps = len(image_paths) + 1
+        cached = len(image_paths) - len(jobs)
+        
+        with ProcessPoolExecutor() as executor:
+            futures = {i: executor.submit(_prepare_one, job) for i, job in jobs.items()}
             
-            with Image.open(img_path) as img:
-                # Convert to RGB if necessary (PDF doesn't support RGBA)
-                if img.mode == 'RGBA':
-                    rgb_img = Image.new('RGB', img.size, (255, 255, 255))
-                    rgb_img.paste(img, mask=img.split()[3])
-                    img = rgb_img
-                elif img.mode != 'RGB':
-                    img = img.convert('RGB')
-                
-                # Resize if a specific page size is requested
-                if page_size != 'FIT' and page_size in self.PAGE_SIZES:
-                    pdf_width, pdf_height = self.PAGE_SIZES[page_size]
-                    img_width, img_height = img.size
-                    
-                    # Calculate aspect ratios
-                    page_ratio = pdf_width / pdf_height
-                    img_ratio = img_width / img_height
-                    
-                    # Resize to fit within page while maintaining aspect ratio
-                    if img_ratio > page_ratio:  # Image is wider
-                        new_width = pdf_width
-                        new_height = int(pdf_width / img_ratio)
-                    else:  # Image is taller
-                        new_height = pdf_height
-                        new_width = int(pdf_height * img_ratio)
-                    
-                    img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-                
-                # Compress if requested
-                if compress:
-                    img.save(temp_path, quality=compression_quality, optimize=True)
-                else:
-                    img.save(temp_path)
+            if callback:
+                # Only report whole-percent changes so large batches don't
+                # flood the UI with repaints
+                last_percent = -1
+                for done, _ in enumerate(as_completed(futures.values()), cached + 1):
+                    progress = done / total_steps
+                    percent = int(progress * 100)
+                    if percent != last_percent:
+                        last_percent = percent
+                        callback(progress)
             
-            prepared_paths.append(temp_path)
+            for i, future in futures.items():
+                prepared_paths[i] = future.result()
         
         return prepared_paths
     
@@ -120,30 +254,26 @@ class PDFConverter:
         if not image_paths:
             raise ValueError("No images provided for conversion")
         
-        total_images = len(image_paths)
         prepared_paths = self._prepare_images(
-            image_paths, page_size, compress, compression_quality
+            image_paths, page_size, compress, compression_quality, callback
         )
         
         # Convert images to PDF with basic functionality
         try:
             if page_size != 'FIT' and page_size in self.PAGE_SIZES:
                 # Use specified page size
-                page_width, page_height = self.PAGE_SIZES[page_size]
-                # Convert points to mm for img2pdf
-                page_width_mm = page_width * 0.352778
-                page_height_mm = page_height * 0.352778
+                layout = _LAYOUT_CACHE.get(page_size)
+                if layout is None:
+                    layout = img2pdf.get_layout_fun(pagesize=self.PAGE_SIZES_MM[page_size])
+                    _LAYOUT_CACHE[page_size] = layout
                 
-                # Create PDF with specified page size
+                # Create PDF with specified page size, streamed straight to disk
                 with open(output_path, "wb") as f:
-                    f.write(img2pdf.convert(prepared_paths, 
-                                          layout_fun=img2pdf.get_layout_fun(
-                                              pagesize=(page_width_mm, page_height_mm)
-                                          )))
+                    img2pdf.convert(prepared_paths, layout_fun=layout, outputstream=f)
             else:
                 # Use original image dimensions (FIT mode)
                 with open(output_path, "wb") as f:
-                    f.write(img2pdf.convert(prepared_paths))
+                    img2pdf.convert(prepared_paths, outputstream=f)
             
             # Report progress if callback is provided
             if callback:
@@ -151,5 +281,37 @@ class PDFConverter:
                 
         except Exception as e:
             raise Exception(f"Failed to convert images to PDF: {str(e)}")
+        finally:
+            if self.cache_dir is not None:
+                self._trim_cache()
         
         return output_path
+    
+    def _trim_cache(self):
+        """Delete the least recently used prepared images above CACHE_MAX_BYTES."""
+        entries = []
+        total = 0
+        try:
+            with os.scandir(self.cache_dir) as it:
+                for entry in it:
+                    # Partial files may belong to a conversion still running
+                    if '.partial' in entry.name or not entry.is_file():
+                        continue
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+                    total += stat.st_size
+        except FileNotFoundError:
+            return
+        
+        if total <= self.CACHE_MAX_BYTES:
+            return
+        
+        entries.sort()
+        for _, size, path in entries:
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            if total <= self.CACHE_MAX_BYTES:
+                break
@@ -7,12 +7,69 @@ and load them later for continued work.
 
 import json
 import os
+import re
+import sys
 from datetime import datetime
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass, asdict
+from typing import List, Dict, Any, Optional, Tuple
+from dataclasses import dataclass, fields
+from functools import lru_cache
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-@dataclass
+# Per-instance __dict__s add up for projects with thousands of images;
+# dataclass slots need Python 3.10, older interpreters keep plain dataclasses
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# save_project writes metadata as the first key, so list_projects can decode it
+# from the head of the file without parsing the images array
+_METADATA_HEAD_BYTES = 4096
+_METADATA_KEY = re.compile(r'\s*\{\s*"metadata"\s*:\s*')
+
+
+def _read_metadata(filepath: str) -> Dict[str, Any]:
+    """
+    Read the metadata object of a project file.
+    
+    Args:
+        filepath: Path to the project file
+        
+    Returns:
+        Dict: Project metadata
+    """
+    with open(filepath, 'r', encoding='utf-8') as f:
+        head = f.read(_METADATA_HEAD_BYTES)
+        match = _METADATA_KEY.match(head)
+        if match:
+            try:
+                metadata, _ = json.JSONDecoder().raw_decode(head, match.end())
+                return metadata
+            except ValueError:
+                # Metadata extends past the head (or the file is malformed)
+                pass
+    return _read_project_dict(filepath).get('metadata', {})
+
+
+def _read_project_dict(filepath: str) -> Dict[str, Any]:
+    """
+    Parse a project file, using orjson when it is installed.
+    
+    Args:
+        filepath: Path to the project file
+        
+    Returns:
+        Dict: Raw project data
+    """
+    if orjson is not None:
+        with open(filepath, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class ProjectMetadata:
     """Metadata for a saved project."""
     name: str
@@ -23,7 +80,7 @@ class ProjectMetadata:
     version: str = "1.0"
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ProjectSettings:
     """Settings for PDF conversion."""
     page_size: str = "A4"
@@ -34,7 +91,7 @@ class ProjectSettings:
     auto_rotate: bool = True
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ImageItem:
     """Individual image item in a project."""
     path: str
@@ -47,7 +104,7 @@ class ImageItem:
     saturation: float = 1.0
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Project:
     """Complete project data structure."""
     metadata: ProjectMetadata
@@ -55,6 +112,37 @@ class Project:
     images: List[ImageItem]
 
 
+@lru_cache(maxsize=None)
+def _field_names(cls: type) -> Tuple[str, ...]:
+    """Return the dataclass field names of a project class."""
+    return tuple(f.name for f in fields(cls))
+
+
+def _shallow_dict(obj: Any) -> Dict[str, Any]:
+    """Map a project dataclass's field names to its field values, uncopied."""
+    return {name: getattr(obj, name) for name in _field_names(type(obj))}
+
+
+def _project_to_dict(project: Project) -> Dict[str, Any]:
+    """
+    Build a JSON-ready view of a project without copying its fields.
+    
+    Unlike dataclasses.asdict, field values are shared with the project
+    objects, so the result must only be read (e.g. by json.dump).
+    
+    Args:
+        project: Project to convert
+        
+    Returns:
+        Dict: Project data keyed like the on-disk format
+    """
+    return {
+        'metadata': _shallow_dict(project.metadata),
+        'settings': _shallow_dict(project.settings),
+        'images': [_shallow_dict(img) for img in project.images]
+    }
+
+
 class ProjectManager:
     """Manages saving and loading of projects."""
     
@@ -70,9 +158,11 @@ class ProjectManager:
         
         self.projects_dir = os.path.abspath(projects_dir)
         
+        # Project summaries keyed by filename, reused while (mtime_ns, size) match
+        self._list_cache: Dict[str, Tuple[int, int, Dict[str, Any]]] = {}
+        
         # Create projects directory if it doesn't exist
-        if not os.path.exists(self.projects_dir):
-            os.makedirs(self.projects_dir)
+        os.makedirs(self.projects_dir, exist_ok=True)
     
     def save_project(self, project: Project, filename: Optional[str] = None) -> str:
         """
@@ -99,12 +189,20 @@ class ProjectManager:
         # Update modification time
         project.metadata.modified = datetime.now().isoformat()
         
-        # Convert to dictionary
-        project_dict = asdict(project)
-        
-        # Save to file
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(project_dict, f, indent=2, ensure_ascii=False)
+        # Save to file (orjson serializes the dataclasses directly)
+        if orjson is not None:
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(project, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filepath, 'w', encoding='utf-8') as f:
+                json.dump(_project_to_dict(project), f, indent=2, ensure_ascii=False)
+        
+        # Prime the listing cache so the next list_projects doesn't re-read it
+        stat = os.stat(filepath)
+        self._list_cache[filename] = (
+            stat.st_mtime_ns, stat.st_size,
+            self._summarize(filename, _shallow_dict(project.metadata), stat.st_size)
+        )
         
         return filepath
     
@@ -123,11 +221,10 @@ class ProjectManager:
         
         filepath = os.path.join(self.projects_dir, filename)
         
-        if not os.path.exists(filepath):
-            raise FileNotFoundError(f"Project file not found: {filepath}")
-        
-        with open(filepath, 'r', encoding='utf-8') as f:
-            project_dict = json.load(f)
+        try:
+            project_dict = _read_project_dict(filepath)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Project file not found: {filepath}") from None
         
         # Convert back to Project object
         metadata = ProjectMetadata(**project_dict['metadata'])
@@ -145,40 +242,66 @@ class ProjectManager:
         """
         projects = []
         
-        if not os.path.exists(self.projects_dir):
+        try:
+            entries = os.scandir(self.projects_dir)
+        except FileNotFoundError:
             return projects
         
-        for filename in os.listdir(self.projects_dir):
-            if not filename.endswith('.json'):
-                continue
-                
-            try:
-                filepath = os.path.join(self.projects_dir, filename)
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    project_dict = json.load(f)
-                
-                # Extract metadata
-                metadata = project_dict.get('metadata', {})
-                
-                projects.append({
-                    'filename': filename,
-                    'name': metadata.get('name', 'Unnamed'),
-                    'created': metadata.get('created', ''),
-                    'modified': metadata.get('modified', ''),
-                    'description': metadata.get('description', ''),
-                    'image_count': metadata.get('image_count', 0),
-                    'file_size': os.path.getsize(filepath)
-                })
-                
-            except Exception as e:
-                print(f"Warning: Could not read project {filename}: {e}")
-                continue
+        seen = set()
+        with entries:
+            for entry in entries:
+                filename = entry.name
+                if not filename.endswith('.json'):
+                    continue
+                seen.add(filename)
+                    
+                try:
+                    stat = entry.stat()
+                    cached = self._list_cache.get(filename)
+                    if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+                        projects.append(dict(cached[2]))
+                        continue
+                    
+                    summary = self._summarize(filename, _read_metadata(entry.path), stat.st_size)
+                    self._list_cache[filename] = (stat.st_mtime_ns, stat.st_size, summary)
+                    projects.append(dict(summary))
+                    
+                except Exception as e:
+                    print(f"Warning: Could not read project {filename}: {e}")
+                    continue
+        
+        # Drop summaries for project files that no longer exist
+        for filename in self._list_cache.keys() - seen:
+            del self._list_cache[filename]
         
         # Sort by modification date (newest first)
         projects.sort(key=lambda p: p['modified'], reverse=True)
         
         return projects
     
+    @staticmethod
+    def _summarize(filename: str, metadata: Dict[str, Any], file_size: int) -> Dict[str, Any]:
+        """
+        Build the list_projects summary of a project file.
+        
+        Args:
+            filename: Name of the project file
+            metadata: The project's metadata fields
+            file_size: Size of the project file in bytes
+            
+        Returns:
+            Dict: Project summary
+        """
+        return {
+            'filename': filename,
+            'name': metadata.get('name', 'Unnamed'),
+            'created': metadata.get('created', ''),
+            'modified': metadata.get('modified', ''),
+            'description': metadata.get('description', ''),
+            'image_count': metadata.get('image_count', 0),
+            'file_size': file_size
+        }
+    
     def delete_project(self, filename: str) -> bool:
         """
         Delete a project file.
@@ -195,10 +318,8 @@ class ProjectManager:
         filepath = os.path.join(self.projects_dir, filename)
         
         try:
-            if os.path.exists(filepath):
-                os.remove(filepath)
-                return True
-            return False
+            os.remove(filepath)
+            return True
         except Exception:
             return False
     
@@ -213,7 +334,7 @@ class ProjectManager:
         Returns:
             str: Path to exported summary
         """
-        summary = f"""
+        header = f"""
 PROJECT SUMMARY
 ===============
 
@@ -235,17 +356,17 @@ IMAGES ({len(project.images)} total)
 ======
 """
         
-        for i, img in enumerate(project.images, 1):
-            status = "✓" if img.enabled else "✗"
-            summary += f"{i:3d}. {status} {os.path.basename(img.path)}\n"
-            if img.rotation != 0:
-                summary += f"       Rotation: {img.rotation}°\n"
-            if img.brightness != 1.0 or img.contrast != 1.0 or img.saturation != 1.0:
-                summary += f"       Adjustments: B:{img.brightness:.1f} C:{img.contrast:.1f} S:{img.saturation:.1f}\n"
-        
-        # Save summary
+        # Write the image lines as they are formatted instead of building the
+        # whole summary in memory
         with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(summary)
+            f.write(header)
+            for i, img in enumerate(project.images, 1):
+                status = "✓" if img.enabled else "✗"
+                f.write(f"{i:3d}. {status} {os.path.basename(img.path)}\n")
+                if img.rotation != 0:
+                    f.write(f"       Rotation: {img.rotation}°\n")
+                if img.brightness != 1.0 or img.contrast != 1.0 or img.saturation != 1.0:
+                    f.write(f"       Adjustments: B:{img.brightness:.1f} C:{img.contrast:.1f} S:{img.saturation:.1f}\n")
         
         return output_path
     
@@ -2,12 +2,82 @@
 Application settings and configuration management.
 """
 
+import atexit
+import hashlib
 import json
 import os
-from dataclasses import dataclass, asdict
-from typing import Dict, Any, Optional
+import shutil
+import threading
+from dataclasses import dataclass, field, fields, is_dataclass
+from typing import Dict, Any, Iterable, Optional, Tuple, Union
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+# Per-user locations, resolved once since Path.home() probes the environment
+_USER_CONFIG_DIR = (Path.home() / "AppData" / "Roaming" / "PDFOrganizer" if os.name == 'nt'
+                    else Path.home() / ".config" / "PDFOrganizer")
+_DEFAULT_TEMP_DIR = str(Path.home() / "AppData" / "Local" / "Temp" / "PDFOrganizer")
+
+
+def _load_json(path: Union[str, Path]) -> Any:
+    """
+    Parse a JSON file with the fastest installed backend.
+    
+    Args:
+        path: Path to the JSON file
+        
+    Returns:
+        Any: Parsed data
+    """
+    with open(path, 'rb') as f:
+        raw = f.read()
+    if orjson is not None:
+        return orjson.loads(raw)
+    if ujson is not None:
+        return ujson.loads(raw)
+    return json.loads(raw.decode('utf-8'))
+
+
+def _dumps_json(data: Any) -> bytes:
+    """
+    Serialize data as 2-space indented UTF-8 JSON.
+    
+    orjson, ujson and the json module all produce byte-identical output here.
+    
+    Args:
+        data: Data to serialize
+        
+    Returns:
+        bytes: Encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    if ujson is not None:
+        return ujson.dumps(data, indent=2, ensure_ascii=False,
+                           escape_forward_slashes=False).encode('utf-8')
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _dump_json(data: Any, path: Union[str, Path]):
+    """
+    Write data to a JSON file in the settings file format.
+    
+    Args:
+        data: Data to serialize
+        path: Path to write to
+    """
+    with open(path, 'wb') as f:
+        f.write(_dumps_json(data))
+
 
 @dataclass
 class PDFSettings:
@@ -19,6 +89,10 @@ class PDFSettings:
     maintain_aspect_ratio: bool = True
 
 
+# Default image extensions, in the order they are written to settings files
+_DEFAULT_IMAGE_FORMATS = ('.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.gif')
+
+
 @dataclass
 class ImageSettings:
     """Image processing settings."""
@@ -27,11 +101,7 @@ class ImageSettings:
     auto_enhance: bool = False
     auto_rotate: bool = True
     remove_metadata: bool = False
-    supported_formats: list = None
-    
-    def __post_init__(self):
-        if self.supported_formats is None:
-            self.supported_formats = ['.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.gif']
+    supported_formats: list = field(default_factory=lambda: list(_DEFAULT_IMAGE_FORMATS))
 
 
 @dataclass
@@ -66,7 +136,7 @@ class AppSettings:
     # Performance settings
     max_concurrent_operations: int = 4
     memory_limit_mb: int = 512
-    temp_directory: str = ""
+    temp_directory: str = _DEFAULT_TEMP_DIR
     
     # Logging settings
     log_level: str = "INFO"  # DEBUG, INFO, WARNING, ERROR
@@ -79,24 +149,40 @@ class AppSettings:
     auto_download_updates: bool = False
     
     # Sub-settings
-    pdf: PDFSettings = None
-    image: ImageSettings = None
-    gui: GUISettings = None
+    pdf: PDFSettings = field(default_factory=PDFSettings)
+    image: ImageSettings = field(default_factory=ImageSettings)
+    gui: GUISettings = field(default_factory=GUISettings)
+
+
+# Nested settings sections of AppSettings and the field names of each class
+_SECTION_TYPES = {f.name: f.type for f in fields(AppSettings) if is_dataclass(f.type)}
+_FIELD_NAMES = {cls: frozenset(f.name for f in fields(cls))
+                for cls in (AppSettings, *_SECTION_TYPES.values())}
+
+
+def _build_field_index() -> Dict[str, Tuple[Optional[str], str]]:
+    """
+    Map every settings key accepted by update_settings to where it lives.
     
-    def __post_init__(self):
-        if self.pdf is None:
-            self.pdf = PDFSettings()
-        if self.image is None:
-            self.image = ImageSettings()
-        if self.gui is None:
-            self.gui = GUISettings()
-        if not self.temp_directory:
-            self.temp_directory = str(Path.home() / "AppData" / "Local" / "Temp" / "PDFOrganizer")
+    Returns:
+        Dict: 'key' or 'section.key' -> (section attribute or None, field name)
+    """
+    index = {name: (None, name) for name in _FIELD_NAMES[AppSettings]}
+    for section, section_type in _SECTION_TYPES.items():
+        for name in _FIELD_NAMES[section_type]:
+            index[f"{section}.{name}"] = (section, name)
+    return index
+
+
+_FIELD_INDEX = _build_field_index()
 
 
 class SettingsManager:
     """Manages application settings with file persistence."""
     
+    # Seconds of quiet after update_settings before the batched save runs
+    SAVE_DELAY = 0.5
+    
     def __init__(self, config_dir: Optional[str] = None):
         """
         Initialize settings manager.
@@ -104,22 +190,24 @@ class SettingsManager:
         Args:
             config_dir: Custom configuration directory
         """
-        if config_dir:
-            self.config_dir = Path(config_dir)
-        else:
-            # Default to user's app data directory
-            if os.name == 'nt':  # Windows
-                app_data = Path.home() / "AppData" / "Roaming"
-            else:  # Unix-like
-                app_data = Path.home() / ".config"
-            
-            self.config_dir = app_data / "PDFOrganizer"
+        # Default to user's app data directory
+        self.config_dir = Path(config_dir) if config_dir else _USER_CONFIG_DIR
         
-        self.config_dir.mkdir(parents=True, exist_ok=True)
         self.config_file = self.config_dir / "settings.json"
         self.backup_file = self.config_dir / "settings.backup.json"
         
         self._settings: Optional[AppSettings] = None
+        
+        # Pending debounced save from update_settings
+        self._save_lock = threading.RLock()
+        self._save_timer: Optional[threading.Timer] = None
+        self._flush_at_exit = False
+        
+        # Digest of the last payload written, to skip saves that change nothing
+        self._saved_digest: Optional[bytes] = None
+        
+        # temp_directory value and the directory already created for it
+        self._cached_temp_dir: Optional[Tuple[str, Path]] = None
     
     def load_settings(self) -> AppSettings:
         """Load settings from file or create defaults."""
@@ -128,8 +216,7 @@ class SettingsManager:
         
         try:
             if self.config_file.exists():
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                data = _load_json(self.config_file)
                 
                 # Validate config version
                 config_version = data.get('config_version', '1.0')
@@ -143,6 +230,11 @@ class SettingsManager:
                 if self._settings.config_version != '1.0':
                     self._migrate_settings()
                 
+            elif self.backup_file.exists():
+                # A save stopped after promoting the old file to the backup but
+                # before moving the new one into place; recover from the backup
+                raise FileNotFoundError(f"{self.config_file} is missing")
+            
             else:
                 # Create default settings
                 self._settings = AppSettings()
@@ -154,8 +246,7 @@ class SettingsManager:
             if self.backup_file.exists():
                 try:
                     print("Attempting to load backup settings...")
-                    with open(self.backup_file, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
+                    data = _load_json(self.backup_file)
                     self._settings = self._dict_to_settings(data)
                 except Exception:
                     print("Backup settings also corrupted, using defaults")
@@ -164,6 +255,7 @@ class SettingsManager:
                 print("Using default settings")
                 self._settings = AppSettings()
         
+        self._publish()
         return self._settings
     
     def save_settings(self) -> bool:
@@ -176,18 +268,39 @@ class SettingsManager:
         if self._settings is None:
             return False
         
+        with self._save_lock:
+            # This save covers anything update_settings still had pending
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            return self._write_settings()
+    
+    def _write_settings(self) -> bool:
+        """Atomically write the current settings, keeping the old file as backup."""
         try:
-            # Create backup of current settings
-            if self.config_file.exists():
-                import shutil
-                shutil.copy2(self.config_file, self.backup_file)
-            
             # Convert settings to dict
             data = self._settings_to_dict(self._settings)
+            payload = _dumps_json(data)
             
-            # Save to file
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            # Nothing changed since the last write, so skip the backup and write
+            digest = hashlib.blake2b(payload, digest_size=16).digest()
+            if digest == self._saved_digest and self.config_file.exists():
+                return True
+            
+            # Write a sibling file first so a failed write never truncates the
+            # settings, then promote the current file to the backup by rename
+            temp_file = self.config_file.with_name(self.config_file.name + '.tmp')
+            self.config_dir.mkdir(parents=True, exist_ok=True)
+            try:
+                temp_file.write_bytes(payload)
+                if self.config_file.exists():
+                    os.replace(self.config_file, self.backup_file)
+                os.replace(temp_file, self.config_file)
+            except BaseException:
+                if temp_file.exists():
+                    temp_file.unlink()
+                raise
+            self._saved_digest = digest
             
             return True
             
@@ -195,6 +308,31 @@ class SettingsManager:
             print(f"Error saving settings: {e}")
             return False
     
+    def flush(self) -> bool:
+        """
+        Write any save still pending from update_settings.
+        
+        Returns:
+            bool: True if nothing was pending or it saved successfully
+        """
+        with self._save_lock:
+            if self._save_timer is None:
+                return True
+            return self.save_settings()
+    
+    def _schedule_save(self):
+        """(Re)start the debounce timer so a burst of updates saves once."""
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+            self._save_timer = threading.Timer(self.SAVE_DELAY, self.flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+            
+            if not self._flush_at_exit:
+                atexit.register(self.flush)
+                self._flush_at_exit = True
+    
     def get_settings(self) -> AppSettings:
         """Get current settings (load if not already loaded)."""
         return self.load_settings()
@@ -203,27 +341,39 @@ class SettingsManager:
         """
         Update specific settings.
         
+        The changes are saved after SAVE_DELAY seconds without further
+        updates, or earlier by flush() or save_settings(); pending changes
+        are flushed at interpreter exit.
+        
         Args:
             **kwargs: Settings to update
             
+        Returns:
+            bool: True if updated successfully
+        """
+        # Unknown keys are ignored
+        return self._apply_assignments(
+            _FIELD_INDEX[key] + (value,) for key, value in kwargs.items() if key in _FIELD_INDEX
+        )
+    
+    def _apply_assignments(self, assignments: Iterable[Tuple[Optional[str], str, Any]]) -> bool:
+        """
+        Set already-resolved settings fields and schedule a save.
+        
+        Args:
+            assignments: (section attribute or None, field name, value) triples
+            
         Returns:
             bool: True if updated successfully
         """
         settings = self.get_settings()
         
         try:
-            for key, value in kwargs.items():
-                if hasattr(settings, key):
-                    setattr(settings, key, value)
-                else:
-                    # Handle nested settings
-                    if '.' in key:
-                        parts = key.split('.', 1)
-                        sub_obj = getattr(settings, parts[0], None)
-                        if sub_obj and hasattr(sub_obj, parts[1]):
-                            setattr(sub_obj, parts[1], value)
+            for section, name, value in assignments:
+                setattr(getattr(settings, section) if section else settings, name, value)
             
-            return self.save_settings()
+            self._schedule_save()
+            return True
             
         except Exception as e:
             print(f"Error updating settings: {e}")
@@ -238,6 +388,7 @@ class SettingsManager:
         """
         try:
             self._settings = AppSettings()
+            self._publish()
             return self.save_settings()
         except Exception as e:
             print(f"Error resetting settings: {e}")
@@ -257,8 +408,7 @@ class SettingsManager:
             settings = self.get_settings()
             data = self._settings_to_dict(settings)
             
-            with open(export_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            _dump_json(data, export_path)
             
             return True
             
@@ -277,10 +427,10 @@ class SettingsManager:
             bool: True if imported successfully
         """
         try:
-            with open(import_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = _load_json(import_path)
             
             self._settings = self._dict_to_settings(data)
+            self._publish()
             return self.save_settings()
             
         except Exception as e:
@@ -288,30 +438,45 @@ class SettingsManager:
             return False
     
     def _dict_to_settings(self, data: Dict[str, Any]) -> AppSettings:
-        """Convert dictionary to AppSettings object."""
-        # Extract nested settings
-        pdf_data = data.pop('pdf', {})
-        image_data = data.pop('image', {})
-        gui_data = data.pop('gui', {})
+        """
+        Convert dictionary to AppSettings object.
         
-        # Create sub-settings
-        pdf_settings = PDFSettings(**pdf_data) if pdf_data else PDFSettings()
-        image_settings = ImageSettings(**image_data) if image_data else ImageSettings()
-        gui_settings = GUISettings(**gui_data) if gui_data else GUISettings()
+        The dictionary is left unmodified, and keys that aren't settings
+        fields (e.g. from a newer version) are ignored.
+        """
+        app_fields = _FIELD_NAMES[AppSettings]
+        kwargs = {}
+        for key, value in data.items():
+            section_type = _SECTION_TYPES.get(key)
+            if section_type is not None:
+                # Create sub-settings
+                names = _FIELD_NAMES[section_type]
+                value = section_type(**{k: v for k, v in (value or {}).items() if k in names})
+            elif key not in app_fields:
+                continue
+            kwargs[key] = value
         
         # Create main settings
-        settings = AppSettings(**data)
-        settings.pdf = pdf_settings
-        settings.image = image_settings
-        settings.gui = gui_settings
-        
-        return settings
+        return AppSettings(**kwargs)
     
     def _settings_to_dict(self, settings: AppSettings) -> Dict[str, Any]:
-        """Convert AppSettings object to dictionary."""
-        data = asdict(settings)
+        """
+        Convert AppSettings object to dictionary.
+        
+        Field values are shared with the settings objects rather than deep
+        copied as asdict() would, so the result is only for serializing.
+        """
+        data = dict(vars(settings))
+        for name in ('pdf', 'image', 'gui'):
+            data[name] = dict(vars(data[name]))
         return data
     
+    def _publish(self):
+        """Rebind CURRENT_SETTINGS when this is the global manager."""
+        global CURRENT_SETTINGS
+        if self is _settings_manager:
+            CURRENT_SETTINGS = self._settings
+    
     def _migrate_settings(self):
         """Migrate settings from older versions."""
         # Add migration logic here as needed
@@ -319,36 +484,53 @@ class SettingsManager:
     
     def get_temp_directory(self) -> Path:
         """Get the temporary directory for the application."""
-        temp_dir = Path(self.get_settings().temp_directory)
+        configured = self.get_settings().temp_directory or _DEFAULT_TEMP_DIR
+        # Keyed on the setting's value so updates, resets, imports and direct
+        # attribute edits all pick up a new directory without a hook each
+        cached = self._cached_temp_dir
+        if cached is not None and cached[0] == configured:
+            return cached[1]
+        
+        temp_dir = Path(configured)
         temp_dir.mkdir(parents=True, exist_ok=True)
+        self._cached_temp_dir = (configured, temp_dir)
         return temp_dir
     
+    def get_cache_directory(self) -> Path:
+        """Get the directory for prepared images reused between conversions."""
+        return self.get_temp_directory() / "prepared"
+    
     def cleanup_temp_directory(self):
         """Clean up temporary files."""
         try:
             temp_dir = self.get_temp_directory()
+            self._cached_temp_dir = None
             if temp_dir.exists():
-                import shutil
                 shutil.rmtree(temp_dir)
         except Exception as e:
             print(f"Error cleaning up temp directory: {e}")
 
 
-# Global settings instance
-_settings_manager = None
+# Global settings instance; construction doesn't touch the disk, so it is
+# safe at import time
+_settings_manager = SettingsManager()
+
+# The global manager's settings once loaded, rebound on reset and import.
+# Read it as settings_manager.CURRENT_SETTINGS: a from-import copies the
+# binding as it was at import time.
+CURRENT_SETTINGS: Optional[AppSettings] = None
 
 
 def get_settings_manager() -> SettingsManager:
     """Get the global settings manager instance."""
-    global _settings_manager
-    if _settings_manager is None:
-        _settings_manager = SettingsManager()
     return _settings_manager
 
 
 def get_settings() -> AppSettings:
     """Get application settings."""
-    return get_settings_manager().get_settings()
+    if CURRENT_SETTINGS is not None:
+        return CURRENT_SETTINGS
+    return _settings_manager.get_settings()
 
 
 def save_settings() -> bool:
@@ -387,10 +569,18 @@ PRESETS = {
 }
 
 
+# Presets with their keys resolved once against the field index, as
+# (section attribute or None, field name, value) triples
+COMPILED_PRESETS = {
+    name: tuple(_FIELD_INDEX[key] + (value,) for key, value in preset.items())
+    for name, preset in PRESETS.items()
+}
+
+
 def apply_preset(preset_name: str) -> bool:
     """Apply a settings preset."""
-    if preset_name not in PRESETS:
+    assignments = COMPILED_PRESETS.get(preset_name)
+    if assignments is None:
         return False
     
-    preset = PRESETS[preset_name]
-    return get_settings_manager().update_settings(**preset)
+    return get_settings_manager()._apply_assignments(assignments)
@@ -0,0 +1,19 @@
+"""
+Shared pytest fixtures.
+"""
+
+import pytest
+from src import settings_manager
+
+
+@pytest.fixture(autouse=True)
+def settings_manager_tmp(monkeypatch, tmp_path):
+    """Point the global settings manager at a per-test config directory."""
+    config_dir = tmp_path / "config"
+    monkeypatch.setattr(settings_manager, '_USER_CONFIG_DIR', config_dir)
+    manager = settings_manager.SettingsManager()
+    monkeypatch.setattr(settings_manager, '_settings_manager', manager)
+    monkeypatch.setattr(settings_manager, 'CURRENT_SETTINGS', None)
+    yield manager
+    # Don't let a debounced save outlive the test's directory
+    manager.flush()
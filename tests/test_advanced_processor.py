@@ -0,0 +1,229 @@
+"""
+Tests for the advanced image processor service.
+"""
+
+import os
+import tempfile
+import pytest
+from PIL import Image
+from src.services.advanced_processor import AdvancedImageProcessor
+
+
+@pytest.fixture
+def temp_dir():
+    """Create a temporary directory and return its path."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        yield temp_dir
+
+
+@pytest.fixture
+def processor():
+    """Create an AdvancedImageProcessor and clean it up afterwards."""
+    processor = AdvancedImageProcessor()
+    yield processor
+    processor.close()
+
+
+def test_optimize_for_pdf_flattens_alpha_without_transparency_key(processor, temp_dir):
+    """Test that RGBA alpha is respected even without a 'transparency' info key."""
+    png_path = os.path.join(temp_dir, "alpha.png")
+    Image.new('RGBA', (100, 100), (0, 0, 0, 0)).save(png_path)
+    
+    output_path = processor.optimize_for_pdf(png_path)
+    
+    with Image.open(output_path) as img:
+        assert img.mode == 'RGB'
+        assert min(img.getpixel((50, 50))) > 245
+
+
+def test_optimize_for_pdf_resizes_large_images(processor, temp_dir):
+    """Test that images larger than the limits are scaled down."""
+    jpg_path = os.path.join(temp_dir, "large.jpg")
+    Image.new('RGB', (3000, 1000), 'blue').save(jpg_path)
+    
+    output_path = processor.optimize_for_pdf(jpg_path, max_width=1500, max_height=1500)
+    
+    with Image.open(output_path) as img:
+        assert img.size == (1500, 500)
+
+
+def test_temp_dir_is_created_lazily(temp_dir):
+    """Test that no temporary directory is created until one is needed."""
+    processor = AdvancedImageProcessor()
+    assert processor._temp_dir is None
+    
+    created = processor.temp_dir
+    assert os.path.isdir(created)
+    
+    processor.close()
+    assert not os.path.exists(created)
+
+
+def test_default_thumbnail_grid_outlives_processor(temp_dir):
+    """Test that the default grid output is not removed when the processor is collected."""
+    jpg_path = os.path.join(temp_dir, "photo.jpg")
+    Image.new('RGB', (100, 100), 'red').save(jpg_path)
+    
+    grid_path = AdvancedImageProcessor().create_thumbnail_grid([jpg_path], (1, 1))
+    
+    try:
+        assert os.path.exists(grid_path)
+    finally:
+        import shutil
+        shutil.rmtree(os.path.dirname(grid_path), ignore_errors=True)
+
+
+def test_context_manager_removes_temp_dir(temp_dir):
+    """Test that leaving a with block cleans up the temporary directory."""
+    jpg_path = os.path.join(temp_dir, "photo.jpg")
+    Image.new('RGB', (100, 100), 'red').save(jpg_path)
+    
+    with AdvancedImageProcessor() as processor:
+        grid_path = processor.create_thumbnail_grid([jpg_path], (1, 1))
+        assert os.path.exists(grid_path)
+    
+    assert not os.path.exists(grid_path)
+
+
+def test_optimize_for_pdf_turbojpeg_matches_pillow(processor, temp_dir):
+    """Test that the libjpeg-turbo path produces the same size as the Pillow path."""
+    from src.services.advanced_processor import _get_turbojpeg
+    
+    jpeg = _get_turbojpeg()
+    if jpeg is None:
+        pytest.skip("libjpeg-turbo is not available")
+    
+    jpg_path = os.path.join(temp_dir, "huge.jpg")
+    Image.new('RGB', (5000, 4000), 'green').save(jpg_path)
+    
+    turbo_path = processor._optimize_jpeg_turbo(
+        jpeg, jpg_path, 1000, 1000, 85, os.path.join(temp_dir, "turbo.jpg"))
+    pillow_path = processor.optimize_for_pdf(jpg_path, max_width=1000, max_height=1000)
+    
+    with Image.open(turbo_path) as turbo, Image.open(pillow_path) as pillow:
+        assert turbo.size == pillow.size == (1000, 800)
+
+
+def save_with_orientation(path, orientation):
+    """Save a 2x1 red/blue image tagged with the given EXIF orientation."""
+    img = Image.new('RGB', (2, 1))
+    img.putpixel((0, 0), (255, 0, 0))
+    img.putpixel((1, 0), (0, 0, 255))
+    exif = img.getexif()
+    exif[0x0112] = orientation
+    img.save(path, exif=exif)
+
+
+def test_auto_rotate_handles_rotation(processor, temp_dir):
+    """Test that a 90 degree EXIF orientation swaps the image dimensions."""
+    png_path = os.path.join(temp_dir, "rotated.png")
+    save_with_orientation(png_path, 6)
+    
+    with Image.open(processor.auto_rotate_image(png_path)) as img:
+        assert img.size == (1, 2)
+
+
+def test_auto_rotate_handles_mirrored_orientation(processor, temp_dir):
+    """Test that mirrored EXIF orientations are applied too."""
+    png_path = os.path.join(temp_dir, "mirrored.png")
+    save_with_orientation(png_path, 2)
+    
+    with Image.open(processor.auto_rotate_image(png_path)) as img:
+        assert img.size == (2, 1)
+        assert img.getpixel((0, 0))[:3] == (0, 0, 255)
+        assert img.getpixel((1, 0))[:3] == (255, 0, 0)
+
+
+def watermark_region(img, text, font_size=36, margin=20):
+    """Return the bottom-right text region used by add_text_watermark."""
+    from src.services.advanced_processor import _measure_text
+    
+    left, top, right, bottom = _measure_text(text, "arial.ttf", font_size)
+    x = img.width - (right - left) - margin
+    y = img.height - (bottom - top) - margin
+    return img.crop((x + left, y + top, x + right, y + bottom))
+
+
+def test_add_text_watermark_only_touches_text_region(processor, temp_dir):
+    """Test that a semi-transparent watermark is blended into the text area only."""
+    jpg_path = os.path.join(temp_dir, "black.png")
+    Image.new('RGB', (400, 200), 'black').save(jpg_path)
+    
+    output_path = processor.add_text_watermark(jpg_path, "Sample", opacity=0.5)
+    
+    with Image.open(output_path) as img:
+        assert img.mode == 'RGB'
+        assert img.getpixel((10, 10)) == (0, 0, 0)
+        
+        # Half-transparent white text over black tops out around mid grey
+        brightest = watermark_region(img, "Sample").getextrema()[0][1]
+        assert 100 < brightest < 160
+
+
+def test_add_text_watermark_flattens_transparent_source(processor, temp_dir):
+    """Test that transparent sources are flattened onto white."""
+    png_path = os.path.join(temp_dir, "transparent.png")
+    Image.new('RGBA', (400, 200), (0, 0, 0, 0)).save(png_path)
+    
+    output_path = processor.add_text_watermark(png_path, "Sample")
+    
+    with Image.open(output_path) as img:
+        assert img.mode == 'RGB'
+        assert img.getpixel((10, 10)) == (255, 255, 255)
+
+
+def test_add_text_watermark_opaque_text(processor, temp_dir):
+    """Test that fully opaque watermarks are drawn in solid white."""
+    png_path = os.path.join(temp_dir, "black.png")
+    Image.new('RGB', (400, 200), 'black').save(png_path)
+    
+    output_path = processor.add_text_watermark(png_path, "Sample", opacity=1.0)
+    
+    with Image.open(output_path) as img:
+        assert img.getpixel((10, 10)) == (0, 0, 0)
+        assert watermark_region(img, "Sample").getextrema()[0][1] >= 250
+
+
+def test_batch_process_folder_selects_images(processor, temp_dir):
+    """Test that batch processing picks image files, symlinked or not, by extension only."""
+    input_dir = os.path.join(temp_dir, "input")
+    output_dir = os.path.join(temp_dir, "output")
+    os.makedirs(os.path.join(input_dir, "nested.png"))
+    Image.new('RGB', (50, 50), 'red').save(os.path.join(input_dir, "photo.JPG"))
+    Image.new('RGB', (50, 50), 'red').save(os.path.join(input_dir, "scan.tif"))
+    Image.new('RGB', (50, 50), 'red').save(os.path.join(input_dir, "web.webp"))
+    open(os.path.join(input_dir, "notes.txt"), "w").close()
+    open(os.path.join(input_dir, "jpg"), "w").close()
+    os.symlink(os.path.join(input_dir, "photo.JPG"), os.path.join(input_dir, "link.jpg"))
+    
+    processed = processor.batch_process_folder(input_dir, output_dir)
+    
+    assert sorted(os.path.basename(p) for p in processed) == [
+        "link.jpg", "photo.JPG", "scan.tif", "web.webp"]
+
+
+def test_create_thumbnail_grid_layout(processor, temp_dir):
+    """Test thumbnail placement, skipped inputs and canvas reuse between calls."""
+    red_path = os.path.join(temp_dir, "red.jpg")
+    broken_path = os.path.join(temp_dir, "broken.jpg")
+    Image.new('RGB', (400, 400), (255, 0, 0)).save(red_path)
+    with open(broken_path, "w") as f:
+        f.write("not an image")
+    
+    grid_path = processor.create_thumbnail_grid(
+        [red_path, broken_path, os.path.join(temp_dir, "missing.jpg"), red_path],
+        (2, 2), (100, 100), os.path.join(temp_dir, "grid.png"))
+    
+    with Image.open(grid_path) as grid:
+        assert grid.size == (200, 200)
+        assert grid.getpixel((50, 50))[0] > 240 and grid.getpixel((50, 50))[1] < 15
+        assert grid.getpixel((150, 50)) == (255, 255, 255)
+        assert grid.getpixel((50, 150)) == (255, 255, 255)
+        assert grid.getpixel((150, 150))[1] < 15
+    
+    # A second grid of the same size must start from a blank canvas
+    grid_path = processor.create_thumbnail_grid(
+        [broken_path], (2, 2), (100, 100), os.path.join(temp_dir, "grid2.png"))
+    
+    with Image.open(grid_path) as grid:
+        assert grid.getextrema() == ((255, 255), (255, 255), (255, 255))
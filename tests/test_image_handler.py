@@ -5,7 +5,7 @@ Tests for the image handler service.
 import os
 import tempfile
 import pytest
-from PIL import Image
+from PIL import Image, JpegImagePlugin
 from src.services.image_handler import ImageHandler
 
 
@@ -36,6 +36,28 @@ def test_is_valid_image():
     assert ImageHandler.is_valid_image("test.pdf") is False
     assert ImageHandler.is_valid_image("test.txt") is False
     assert ImageHandler.is_valid_image("test") is False
+    assert ImageHandler.is_valid_image("photos.jpg/readme") is False
+    assert ImageHandler.is_valid_image("jpg") is False
+
+    # Extensions are matched case-insensitively
+    assert ImageHandler.is_valid_image("SCAN.JPG") is True
+
+
+def test_filter_valid_images():
+    """Test the filter_valid_images method on path lists and directories."""
+    paths = ["a.jpg", "notes.txt", "b.PNG", "archive", "c.gif"]
+    assert ImageHandler.filter_valid_images(paths) == ["a.jpg", "b.PNG", "c.gif"]
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for name in ("b.png", "a.JPG", "readme.txt", "jpg"):
+            with open(os.path.join(temp_dir, name), 'wb') as f:
+                f.write(b'')
+        os.mkdir(os.path.join(temp_dir, "folder.jpg"))
+
+        assert ImageHandler.filter_valid_images(temp_dir) == [
+            os.path.join(temp_dir, "a.JPG"),
+            os.path.join(temp_dir, "b.png"),
+        ]
 
 
 def test_get_image_dimensions(temp_image):
@@ -83,3 +105,80 @@ def test_compress_image(temp_image):
     # Check if the file size has decreased
     compressed_size = os.path.getsize(compressed_path)
     assert compressed_size < original_size
+
+
+def test_compress_image_jpeg_encoding_options(temp_image):
+    """Test that compressed JPEGs are progressive with the requested subsampling."""
+    temp_dir = os.path.dirname(temp_image)
+    default_path = os.path.join(temp_dir, "default.jpg")
+    full_chroma_path = os.path.join(temp_dir, "full_chroma.jpg")
+    
+    ImageHandler.compress_image(temp_image, quality=95, output_path=default_path)
+    ImageHandler.compress_image(temp_image, quality=95, output_path=full_chroma_path,
+                                subsampling=0)
+    
+    with Image.open(default_path) as img:
+        assert img.info.get('progressive') == 1
+        assert JpegImagePlugin.get_sampling(img) == 2
+    with Image.open(full_chroma_path) as img:
+        assert JpegImagePlugin.get_sampling(img) == 0
+
+
+def test_compress_image_flattens_transparency(temp_image):
+    """Test that transparent PNG pixels are composited onto white."""
+    temp_dir = os.path.dirname(temp_image)
+    png_path = os.path.join(temp_dir, "transparent.png")
+    compressed_path = os.path.join(temp_dir, "flattened.jpg")
+    
+    img = Image.new('RGBA', (100, 100), (0, 0, 0, 0))
+    img.paste((255, 0, 0, 255), (0, 0, 50, 100))
+    img.save(png_path)
+    
+    ImageHandler.compress_image(png_path, quality=95, output_path=compressed_path)
+    
+    with Image.open(compressed_path) as result:
+        assert result.mode == 'RGB'
+        r, g, b = result.getpixel((75, 50))
+        assert min(r, g, b) > 245
+        r, g, b = result.getpixel((25, 50))
+        assert r > 245 and g < 10 and b < 10
+
+
+def test_in_place_writes_replace_the_original_atomically(temp_image, monkeypatch):
+    """Test that overwriting the source goes through a temporary file."""
+    temp_dir = os.path.dirname(temp_image)
+    os.chmod(temp_image, 0o644)
+    with open(temp_image, 'rb') as f:
+        original = f.read()
+
+    # A failed save leaves the original untouched and no temporary file behind
+    def failing_save(self, fp, *args, **kwargs):
+        with open(fp, 'wb') as f:
+            f.write(b'partial')
+        raise OSError("disk full")
+
+    with monkeypatch.context() as m:
+        m.setattr(Image.Image, 'save', failing_save)
+        with pytest.raises(OSError):
+            ImageHandler.compress_image(temp_image, quality=10)
+
+    with open(temp_image, 'rb') as f:
+        assert f.read() == original
+    assert os.listdir(temp_dir) == ["test_image.jpg"]
+
+    # A successful in-place resize keeps the file's permissions
+    ImageHandler.resize_image(temp_image, (40, 30))
+    with Image.open(temp_image) as img:
+        assert img.size == (40, 30)
+    assert os.stat(temp_image).st_mode & 0o777 == 0o644
+    assert os.listdir(temp_dir) == ["test_image.jpg"]
+
+
+def test_resize_image_skips_same_size_in_place(temp_image, monkeypatch):
+    """Test that resizing in place to the current size does not re-encode."""
+    def unexpected_save(self, *args, **kwargs):
+        raise AssertionError("image was re-encoded")
+
+    monkeypatch.setattr(Image.Image, 'save', unexpected_save)
+
+    assert ImageHandler.resize_image(temp_image, (100, 100)) == temp_image
@@ -2,6 +2,7 @@
 Tests for the PDF converter service.
 """
 
+import io
 import os
 import tempfile
 import pytest
@@ -10,20 +11,31 @@ import img2pdf
 from src.services.pdf_converter import PDFConverter
 
 
+@pytest.fixture(scope="session")
+def encoded_images():
+    """Encode the test images once and return their names and JPEG bytes."""
+    encoded = []
+    
+    for i, color in enumerate([(255, 0, 0), (0, 255, 0), (0, 0, 255)]):
+        buffer = io.BytesIO()
+        Image.new('RGB', (100, 100), color=color).save(buffer, 'JPEG')
+        encoded.append((f"test_image_{i}.jpg", buffer.getvalue()))
+    
+    return encoded
+
+
 @pytest.fixture
-def temp_images():
+def temp_images(encoded_images):
     """Create temporary test images and return their paths."""
     # Create a temporary directory
     with tempfile.TemporaryDirectory() as temp_dir:
-        # Create multiple test images
+        # Write fresh copies, since some tests modify their inputs
         image_paths = []
         
-        for i in range(3):
-            img_path = os.path.join(temp_dir, f"test_image_{i}.jpg")
-            img = Image.new('RGB', (100, 100), color=(255, 0, 0) if i == 0 else
-                                                     (0, 255, 0) if i == 1 else
-                                                     (0, 0, 255))
-            img.save(img_path)
+        for name, data in encoded_images:
+            img_path = os.path.join(temp_dir, name)
+            with open(img_path, 'wb') as f:
+                f.write(data)
             image_paths.append(img_path)
         
         yield image_paths, temp_dir
@@ -72,23 +84,51 @@ def test_convert_images_to_pdf_with_compression(temp_images):
     assert os.path.getsize(output_path) > 0
 
 
-def test_convert_images_to_pdf_with_different_page_sizes(temp_images):
+@pytest.mark.parametrize('page_size', ['A4', 'LETTER', 'LEGAL', 'TABLOID', 'FIT'])
+def test_convert_images_to_pdf_with_different_page_sizes(temp_images, page_size):
     """Test PDF conversion with different page sizes."""
     image_paths, temp_dir = temp_images
+    output_path = os.path.join(temp_dir, f"output_{page_size}.pdf")
+    
+    # Test with different page sizes
+    converter = PDFConverter()
+    converter.convert_images_to_pdf(
+        image_paths=image_paths,
+        output_path=output_path,
+        page_size=page_size
+    )
     
-    for page_size in ['A4', 'LETTER', 'LEGAL', 'TABLOID', 'FIT']:
-        output_path = os.path.join(temp_dir, f"output_{page_size}.pdf")
+    # Check if the PDF was created
+    assert os.path.exists(output_path)
+    assert os.path.getsize(output_path) > 0
+
+
+def test_prepare_images_passes_through_unchanged_images(temp_images):
+    """Test that RGB JPEGs are not re-encoded when no conversion is needed."""
+    image_paths, temp_dir = temp_images
+    
+    converter = PDFConverter()
+    assert converter._prepare_images(image_paths, 'FIT') == image_paths
+    
+    # Resizing still goes through the temp directory
+    prepared = converter._prepare_images(image_paths, 'A4')
+    assert all(os.path.dirname(p) == converter.temp_dir for p in prepared)
+
+
+@pytest.mark.parametrize("orientation", [0, 6, 9])
+def test_convert_jpeg_with_exif_orientation_in_fit_mode(orientation):
+    """Test that EXIF orientations, valid or not, don't break FIT conversion."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        img_path = os.path.join(temp_dir, "oriented.jpg")
+        exif = Image.Exif()
+        exif[0x0112] = orientation
+        Image.new('RGB', (40, 20), color='red').save(img_path, exif=exif)
         
-        # Test with different page sizes
         converter = PDFConverter()
-        converter.convert_images_to_pdf(
-            image_paths=image_paths,
-            output_path=output_path,
-            page_size=page_size
-        )
+        assert converter._prepare_images([img_path], 'FIT') != [img_path]
         
-        # Check if the PDF was created
-        assert os.path.exists(output_path)
+        output_path = os.path.join(temp_dir, "oriented.pdf")
+        assert converter.convert_images_to_pdf([img_path], output_path, page_size='FIT')
         assert os.path.getsize(output_path) > 0
 
 
@@ -119,6 +159,102 @@ def test_convert_images_to_pdf_with_callback(temp_images):
     assert progress_values[-1] == 1.0  # Final progress should be 100%
 
 
+def test_convert_images_to_pdf_reports_progress_per_image(temp_images):
+    """Test that progress is reported while images are being prepared."""
+    image_paths, temp_dir = temp_images
+    output_path = os.path.join(temp_dir, "output_progress.pdf")
+    
+    progress_values = []
+    
+    converter = PDFConverter()
+    converter.convert_images_to_pdf(
+        image_paths=image_paths,
+        output_path=output_path,
+        callback=progress_values.append
+    )
+    
+    # One update per prepared image plus the final one
+    assert len(progress_values) == len(image_paths) + 1
+    assert progress_values == sorted(progress_values)
+    assert progress_values[-1] == 1.0
+
+
+def test_prepare_images_throttles_progress_to_whole_percents(temp_images):
+    """Test that large batches report at most one update per percent."""
+    _, temp_dir = temp_images
+    image_paths = []
+    for i in range(300):
+        path = os.path.join(temp_dir, f"tiny_{i}.png")
+        Image.new('RGB', (1, 1), color='white').save(path)
+        image_paths.append(path)
+    
+    progress_values = []
+    
+    converter = PDFConverter()
+    converter._prepare_images(image_paths, 'FIT', callback=progress_values.append)
+    
+    percents = [int(p * 100) for p in progress_values]
+    assert len(percents) == len(set(percents))
+    assert percents == sorted(percents)
+    assert percents[-1] == 99
+
+
+def test_prepare_images_reuses_cached_copies(temp_images):
+    """Test that a cache directory lets later conversions skip preparation."""
+    image_paths, temp_dir = temp_images
+    cache_dir = os.path.join(temp_dir, "cache")
+    
+    first = PDFConverter(cache_dir=cache_dir)._prepare_images(image_paths, 'A4')
+    assert all(os.path.dirname(path) == cache_dir for path in first)
+    assert len(set(first)) == len(image_paths)
+    inodes = [os.stat(path).st_ino for path in first]
+    
+    # A new converter finds the same copies without rewriting them
+    progress_values = []
+    second = PDFConverter(cache_dir=cache_dir)._prepare_images(
+        image_paths, 'A4', callback=progress_values.append
+    )
+    assert second == first
+    assert [os.stat(path).st_ino for path in second] == inodes
+    assert progress_values == []
+    
+    # Different options or a modified source need a fresh copy
+    compressed = PDFConverter(cache_dir=cache_dir)._prepare_images(
+        image_paths, 'A4', compress=True
+    )
+    assert set(compressed).isdisjoint(first)
+    
+    Image.new('RGB', (120, 100), color='green').save(image_paths[0])
+    third = PDFConverter(cache_dir=cache_dir)._prepare_images(image_paths, 'A4')
+    assert third[0] != first[0]
+    assert third[1:] == first[1:]
+    assert not any('.partial' in name for name in os.listdir(cache_dir))
+
+
+def test_convert_images_to_pdf_trims_cache(temp_images, monkeypatch):
+    """Test that the cache keeps only the most recently used copies within its budget."""
+    image_paths, temp_dir = temp_images
+    cache_dir = os.path.join(temp_dir, "cache")
+    output_path = os.path.join(temp_dir, "output.pdf")
+    
+    converter = PDFConverter(cache_dir=cache_dir)
+    first = converter._prepare_images(image_paths, 'A4')
+    for age, path in enumerate(first, 1):
+        os.utime(path, (1000 - age, 1000 - age))
+    
+    # Room for the three copies the compressed run uses plus one more
+    budget = sum(os.path.getsize(path) for path in first[:1])
+    compressed = converter._prepare_images(image_paths, 'A4', compress=True)
+    budget += sum(os.path.getsize(path) for path in compressed)
+    monkeypatch.setattr(PDFConverter, 'CACHE_MAX_BYTES', budget)
+    
+    converter.convert_images_to_pdf(image_paths, output_path, page_size='A4', compress=True)
+    
+    # The oldest uncompressed copies go first; everything just used stays
+    assert sorted(os.listdir(cache_dir)) == sorted(
+        os.path.basename(path) for path in compressed + first[:1])
+
+
 def test_convert_empty_image_list():
     """Test handling of empty image list."""
     converter = PDFConverter()
@@ -0,0 +1,165 @@
+"""
+Tests for the plugin system.
+"""
+
+import json
+import os
+import sys
+import tempfile
+import pytest
+from src.plugin_system import PluginManager
+
+
+@pytest.fixture
+def manager():
+    """Create a plugin manager without any plugin directories."""
+    manager = PluginManager()
+    manager.plugin_directories = []
+    return manager
+
+
+def write_manifest(plugin_dir, **overrides):
+    """Write a plugin manifest into plugin_dir and return its path."""
+    os.makedirs(plugin_dir, exist_ok=True)
+    manifest = {"name": os.path.basename(plugin_dir), "version": "1.0.0"}
+    manifest.update(overrides)
+    manifest_path = os.path.join(plugin_dir, "manifest.json")
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f)
+    return manifest_path
+
+
+@pytest.fixture
+def plugins_dir():
+    """Create a temporary plugins directory."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        yield temp_dir
+
+
+def test_discover_plugins_skips_non_plugins(manager, plugins_dir):
+    """Test that only directories with a manifest are discovered."""
+    write_manifest(os.path.join(plugins_dir, "alpha"))
+    os.makedirs(os.path.join(plugins_dir, "no_manifest"))
+    open(os.path.join(plugins_dir, "stray_file.txt"), "w").close()
+    
+    manager.plugin_directories = [plugins_dir, os.path.join(plugins_dir, "missing")]
+    discovered = manager.discover_plugins()
+    
+    assert [metadata.name for metadata in discovered] == ["alpha"]
+    assert "alpha" in manager.plugin_metadata
+
+
+def test_discover_plugins_reuses_unchanged_manifests(manager, plugins_dir):
+    """Test that manifests are only re-parsed after they change."""
+    manifest_path = write_manifest(os.path.join(plugins_dir, "alpha"))
+    manager.plugin_directories = [plugins_dir]
+    
+    first = manager.discover_plugins()[0]
+    assert manager.discover_plugins()[0] is first
+    
+    # Rewrite with a newer mtime to invalidate the cached entry
+    write_manifest(os.path.join(plugins_dir, "alpha"), version="2.0.0")
+    stat = os.stat(manifest_path)
+    os.utime(manifest_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    
+    updated = manager.discover_plugins()[0]
+    assert updated is not first
+    assert updated.version == "2.0.0"
+
+
+PLUGIN_SOURCE = """
+from src.plugin_system import PluginInterface
+
+
+class CountingPlugin(PluginInterface):
+    name = "Counting"
+    version = "1.0.0"
+    description = "Test plugin"
+    author = "Tests"
+
+    def initialize(self):
+        return True
+
+    def cleanup(self):
+        return True
+"""
+
+
+def test_load_plugin_caches_plugin_class(manager, plugins_dir):
+    """Test that reloading a plugin reuses the resolved class without re-importing."""
+    plugin_dir = os.path.join(plugins_dir, "counting")
+    module_name = "counting_plugin_under_test"
+    write_manifest(plugin_dir, name="Counting", main_module=module_name,
+                   plugin_class="CountingPlugin")
+    with open(os.path.join(plugin_dir, f"{module_name}.py"), "w", encoding="utf-8") as f:
+        f.write(PLUGIN_SOURCE)
+    
+    manager.plugin_directories = [plugins_dir]
+    manager.discover_plugins()
+    
+    try:
+        assert manager.load_plugin("Counting") is True
+        plugin_class = type(manager.get_plugin("Counting"))
+        
+        # Drop the module so a real import would be visible in sys.modules again
+        del sys.modules[module_name]
+        assert manager.reload_plugin("Counting") is True
+        
+        assert type(manager.get_plugin("Counting")) is plugin_class
+        assert module_name not in sys.modules
+    finally:
+        sys.modules.pop(module_name, None)
+        if plugin_dir in sys.path:
+            sys.path.remove(plugin_dir)
+
+
+def test_execute_hook_collects_results(manager):
+    """Test that hook results are collected and failing callbacks are skipped."""
+    def failing(value):
+        raise ValueError("boom")
+    
+    assert manager.register_hook('on_image', lambda value: value * 2) is True
+    assert manager.register_hook('on_image', failing) is True
+    
+    assert manager.execute_hook('on_image', 3) == [6]
+    assert manager.execute_hook('unknown_hook', 3) == []
+
+
+def test_register_hook_rejects_duplicates(manager):
+    """Test that the same callback is only registered once."""
+    def callback():
+        return 1
+    
+    assert manager.register_hook('on_start', callback) is True
+    assert manager.register_hook('on_start', callback) is False
+    assert manager.execute_hook('on_start') == [1]
+
+
+def test_unregister_hook_updates_dispatch(manager):
+    """Test that unregistered callbacks are no longer executed."""
+    def first():
+        return 'first'
+    
+    def second():
+        return 'second'
+    
+    manager.register_hook('on_save', first)
+    manager.register_hook('on_save', second)
+    assert manager.unregister_hook('on_save', first) is True
+    assert manager.execute_hook('on_save') == ['second']
+    
+    assert manager.unregister_hook('on_save', second) is True
+    assert manager.execute_hook('on_save') == []
+    assert manager.unregister_hook('on_save', second) is False
+
+
+def test_hooks_view_is_read_only(manager):
+    """Test that the public hooks view cannot be used to bypass registration."""
+    def callback():
+        return None
+    
+    manager.register_hook('on_load', callback)
+    
+    assert manager.hooks['on_load'] == (callback,)
+    with pytest.raises(TypeError):
+        manager.hooks['on_load'] = []
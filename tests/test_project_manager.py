@@ -0,0 +1,157 @@
+"""
+Tests for the project manager service.
+"""
+
+import os
+import json
+import re
+import tempfile
+import pytest
+from src.services import project_manager
+from src.services.project_manager import ProjectManager
+
+
+@pytest.fixture
+def manager():
+    """Create a project manager backed by a temporary directory."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        yield ProjectManager(projects_dir=temp_dir)
+
+
+@pytest.fixture
+def image_paths():
+    """Create a few placeholder image files and return their paths."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        paths = []
+        for i in range(3):
+            path = os.path.join(temp_dir, f"image_{i}.jpg")
+            with open(path, 'wb') as f:
+                f.write(b'')
+            paths.append(path)
+        yield paths
+
+
+def test_save_and_load_project_round_trip(manager, image_paths):
+    """Test that a saved project loads back with the same contents."""
+    project = manager.create_project_from_images(image_paths, "Holiday", "Beach photos")
+    project.images[1].rotation = 90
+
+    filepath = manager.save_project(project, "holiday")
+    loaded = manager.load_project("holiday")
+
+    assert os.path.basename(filepath) == "holiday.json"
+    assert loaded == project
+
+    assert manager.delete_project("holiday") is True
+    assert manager.delete_project("holiday") is False
+    with pytest.raises(FileNotFoundError, match="Project file not found"):
+        manager.load_project("holiday")
+
+
+@pytest.mark.skipif(project_manager.orjson is None, reason="orjson not installed")
+def test_orjson_and_json_write_identical_files(manager, image_paths, monkeypatch):
+    """Test that the optional orjson backend keeps the on-disk format unchanged."""
+    project = manager.create_project_from_images(image_paths, "Café", "Ünïcödé")
+    project.images[0].brightness = 1.25
+
+    paths = [manager.save_project(project, "with_orjson")]
+    monkeypatch.setattr(project_manager, 'orjson', None)
+    paths.append(manager.save_project(project, "with_json"))
+
+    contents = []
+    for path in paths:
+        with open(path, 'rb') as f:
+            # save_project stamps a fresh modification time on every save
+            contents.append(re.sub(rb'"modified": "[^"]*"', b'', f.read()))
+
+    assert contents[0] == contents[1]
+    assert "Café".encode('utf-8') in contents[0]
+
+
+def test_list_projects_reuses_unchanged_summaries(manager, image_paths, monkeypatch):
+    """Test that list_projects only re-reads project files that changed."""
+    manager.save_project(manager.create_project_from_images(image_paths, "First"), "first")
+    manager.save_project(manager.create_project_from_images(image_paths, "Second"), "second")
+
+    assert {p['name'] for p in manager.list_projects()} == {"First", "Second"}
+
+    loads = []
+    real_read = project_manager._read_metadata
+    monkeypatch.setattr(project_manager, '_read_metadata',
+                        lambda path: loads.append(path) or real_read(path))
+
+    # Mutating a returned summary must not leak into the cache
+    manager.list_projects()[0]['name'] = "Changed"
+    assert {p['name'] for p in manager.list_projects()} == {"First", "Second"}
+    assert loads == []
+
+    # Saving through the manager primes the cache with the new summary
+    second = manager.load_project("second")
+    second.metadata.name = "Second (edited)"
+    manager.save_project(second, "second")
+
+    assert {p['name'] for p in manager.list_projects()} == {"First", "Second (edited)"}
+    assert loads == []
+
+    # Editing a file behind the manager's back invalidates only its entry
+    second_path = os.path.join(manager.projects_dir, "second.json")
+    with open(second_path, encoding='utf-8') as f:
+        data = json.load(f)
+    data['metadata']['description'] = "edited by hand"
+    with open(second_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+
+    projects = {p['name']: p for p in manager.list_projects()}
+    assert projects["Second (edited)"]['description'] == "edited by hand"
+    assert projects["Second (edited)"]['file_size'] == os.path.getsize(second_path)
+    assert [os.path.basename(name) for name in loads] == ["second.json"]
+
+    # Deleted projects disappear from the listing and the cache
+    manager.delete_project("first")
+    assert [p['name'] for p in manager.list_projects()] == ["Second (edited)"]
+    assert set(manager._list_cache) == {"second.json"}
+
+
+def test_list_projects_reads_metadata_from_any_layout(manager, image_paths):
+    """Test metadata extraction for oversized metadata and hand-edited files."""
+    manager.save_project(manager.create_project_from_images(image_paths, "Long", "x" * 10000), "long")
+
+    # A file whose keys are not in save_project's order needs a full parse
+    reordered = {
+        'images': [],
+        'metadata': {'name': "Reordered", 'created': "", 'modified': "2000-01-01",
+                     'description': "", 'image_count': 0},
+        'settings': {},
+    }
+    with open(os.path.join(manager.projects_dir, "reordered.json"), 'w', encoding='utf-8') as f:
+        json.dump(reordered, f)
+
+    projects = {p['name']: p for p in manager.list_projects()}
+
+    assert projects["Long"]['description'] == "x" * 10000
+    assert projects["Long"]['image_count'] == 3
+    assert projects["Reordered"]['modified'] == "2000-01-01"
+
+
+def test_export_project_summary(manager, image_paths):
+    """Test the human-readable summary lists every image and its edits."""
+    project = manager.create_project_from_images(image_paths, "Summary", "Scans")
+    project.images[0].rotation = 90
+    project.images[1].enabled = False
+    project.images[2].contrast = 1.5
+
+    output_path = os.path.join(manager.projects_dir, "summary.txt")
+    assert manager.export_project_summary(project, output_path) == output_path
+
+    with open(output_path, encoding='utf-8') as f:
+        summary = f.read()
+
+    assert "Project Name: Summary" in summary
+    assert "IMAGES (3 total)" in summary
+    assert summary.endswith(
+        "  1. ✓ image_0.jpg\n"
+        "       Rotation: 90°\n"
+        "  2. ✗ image_1.jpg\n"
+        "  3. ✓ image_2.jpg\n"
+        "       Adjustments: B:1.0 C:1.5 S:1.0\n"
+    )
@@ -0,0 +1,292 @@
+"""
+Tests for the settings manager.
+"""
+
+import os
+import time
+import tempfile
+import pytest
+from src import settings_manager
+from src.settings_manager import SettingsManager
+
+
+@pytest.fixture
+def config_dir():
+    """Create a temporary configuration directory."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        yield temp_dir
+
+
+@pytest.fixture
+def manager(config_dir):
+    """Create a settings manager backed by a temporary directory."""
+    return SettingsManager(config_dir=config_dir)
+
+
+def test_settings_round_trip(manager, config_dir):
+    """Test that saved settings load back in a new manager."""
+    manager.update_settings(log_level="DEBUG", **{'pdf.default_quality': 60})
+    assert manager.flush()
+
+    settings = SettingsManager(config_dir=config_dir).get_settings()
+
+    assert settings.log_level == "DEBUG"
+    assert settings.pdf.default_quality == 60
+    assert settings.gui == manager.get_settings().gui
+
+
+@pytest.mark.parametrize("backend", ["orjson", "ujson"])
+def test_json_backends_write_identical_files(manager, config_dir, monkeypatch, backend):
+    """Test that the optional JSON backends keep the file format unchanged."""
+    if getattr(settings_manager, backend) is None:
+        pytest.skip(f"{backend} not installed")
+    for other in ("orjson", "ujson"):
+        if other != backend:
+            monkeypatch.setattr(settings_manager, other, None)
+
+    manager.update_settings(**{'gui.last_input_directory': "C:/Users/Zoë/Bilder"})
+    manager.flush()
+
+    with_backend = os.path.join(config_dir, "with_backend.json")
+    with_json = os.path.join(config_dir, "with_json.json")
+    manager.export_settings(with_backend)
+    assert manager.import_settings(with_backend)
+    monkeypatch.setattr(settings_manager, backend, None)
+    manager.export_settings(with_json)
+
+    with open(with_backend, 'rb') as f, open(with_json, 'rb') as g:
+        assert f.read() == g.read()
+
+    assert manager.get_settings().gui.last_input_directory == "C:/Users/Zoë/Bilder"
+
+
+def test_load_settings_falls_back_to_backup(manager, config_dir):
+    """Test that a corrupted settings file is replaced by the backup's contents."""
+    manager.update_settings(log_level="WARNING")
+    manager.flush()
+    manager.update_settings(log_level="ERROR")
+    manager.flush()
+
+    with open(os.path.join(config_dir, "settings.json"), 'w', encoding='utf-8') as f:
+        f.write("{ not json")
+
+    assert SettingsManager(config_dir=config_dir).get_settings().log_level == "WARNING"
+
+
+def test_save_settings_persists_direct_attribute_changes(manager, config_dir):
+    """Test that fields changed on the live settings object are saved."""
+    settings = manager.get_settings()
+    settings.gui.theme = "light"
+    settings.image.supported_formats.append('.webp')
+    assert manager.save_settings()
+
+    reloaded = SettingsManager(config_dir=config_dir).get_settings()
+
+    assert reloaded == settings
+    assert reloaded.gui.theme == "light"
+
+
+def test_update_settings_coalesces_saves(manager, config_dir, monkeypatch):
+    """Test that a burst of updates is written once, after the debounce delay."""
+    manager.get_settings()
+    writes = []
+    real_write = manager._write_settings
+
+    def counting_write():
+        result = real_write()
+        writes.append(1)
+        return result
+
+    monkeypatch.setattr(manager, '_write_settings', counting_write)
+
+    # Nothing is written while updates keep arriving
+    monkeypatch.setattr(manager, 'SAVE_DELAY', 60)
+    for quality in (70, 75, 80):
+        assert manager.update_settings(**{'pdf.default_quality': quality})
+    assert writes == []
+
+    assert manager.flush()
+    assert writes == [1]
+    assert manager.flush()
+    assert writes == [1]
+
+    # The timer saves on its own once updates stop
+    monkeypatch.setattr(manager, 'SAVE_DELAY', 0.01)
+    manager.update_settings(log_level="ERROR")
+    deadline = time.monotonic() + 5
+    while len(writes) < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert writes == [1, 1]
+    assert SettingsManager(config_dir=config_dir).get_settings().log_level == "ERROR"
+
+
+def test_save_settings_skips_unchanged_payload(manager, config_dir):
+    """Test that saving identical settings neither rewrites nor backs up the file."""
+    settings_path = os.path.join(config_dir, "settings.json")
+    backup_path = os.path.join(config_dir, "settings.backup.json")
+
+    manager.get_settings()
+    written = os.stat(settings_path).st_mtime_ns
+
+    time.sleep(0.01)
+    assert manager.save_settings()
+    assert os.stat(settings_path).st_mtime_ns == written
+    assert not os.path.exists(backup_path)
+
+    manager.get_settings().gui.theme = "light"
+    assert manager.save_settings()
+    assert os.path.exists(backup_path)
+
+    # A deleted file is rewritten even though the settings are unchanged
+    os.remove(settings_path)
+    assert manager.save_settings()
+    assert os.path.exists(settings_path)
+
+
+def test_interrupted_save_recovers_from_backup(manager, config_dir, monkeypatch):
+    """Test that a failed or half-finished save never loses the settings."""
+    settings_path = os.path.join(config_dir, "settings.json")
+    backup_path = os.path.join(config_dir, "settings.backup.json")
+    manager.update_settings(log_level="WARNING")
+    manager.flush()
+
+    # A write that fails leaves the current file and no temporary behind
+    with open(settings_path, 'rb') as f:
+        saved = f.read()
+    def failing_write(self, data):
+        raise OSError("disk full")
+
+    with monkeypatch.context() as m:
+        m.setattr(settings_manager.Path, 'write_bytes', failing_write)
+        manager.get_settings().log_level = "ERROR"
+        assert manager.save_settings() is False
+    with open(settings_path, 'rb') as f:
+        assert f.read() == saved
+    assert sorted(os.listdir(config_dir)) == ["settings.backup.json", "settings.json"]
+
+    # Stopping between the two renames leaves only the backup
+    os.replace(settings_path, backup_path)
+    assert SettingsManager(config_dir=config_dir).get_settings().log_level == "WARNING"
+
+
+def test_config_dir_is_created_on_first_save(config_dir):
+    """Test that constructing a manager leaves the filesystem untouched."""
+    nested = os.path.join(config_dir, "nested", "PDFOrganizer")
+    manager = SettingsManager(config_dir=nested)
+
+    assert not os.path.exists(nested)
+
+    manager.get_settings()
+    assert os.path.exists(os.path.join(nested, "settings.json"))
+
+
+def test_current_settings_follows_the_global_manager(config_dir, settings_manager_tmp):
+    """Test that CURRENT_SETTINGS tracks loads, resets and imports."""
+    global_manager = settings_manager.get_settings_manager()
+    assert global_manager is settings_manager_tmp
+
+    settings = settings_manager.get_settings()
+    assert settings_manager.CURRENT_SETTINGS is settings
+    assert settings_manager.get_settings() is settings
+
+    assert global_manager.reset_to_defaults()
+    assert settings_manager.CURRENT_SETTINGS is global_manager.get_settings()
+    assert settings_manager.CURRENT_SETTINGS is not settings
+
+    # Other managers never replace the global settings
+    SettingsManager(config_dir=os.path.join(config_dir, "other")).reset_to_defaults()
+    assert settings_manager.CURRENT_SETTINGS is global_manager.get_settings()
+
+
+def test_update_settings_only_touches_known_fields(manager):
+    """Test that update_settings sets known keys and ignores everything else."""
+    settings = manager.get_settings()
+
+    assert manager.update_settings(**{
+        'memory_limit_mb': 1024,
+        'gui.thumbnail_size': 200,
+        'unknown_flag': True,
+        'gui.unknown_field': 1,
+        'image.max_width.extra': 5,
+        '__class__': None,
+    })
+    manager.flush()
+
+    assert settings.memory_limit_mb == 1024
+    assert settings.gui.thumbnail_size == 200
+    assert not hasattr(settings, 'unknown_flag')
+    assert not hasattr(settings.gui, 'unknown_field')
+    assert settings.image.max_width == 2048
+    assert type(settings) is settings_manager.AppSettings
+
+
+def test_dict_to_settings_ignores_unknown_keys_without_mutating(manager):
+    """Test that settings data from a newer version loads without being modified."""
+    data = {
+        'log_level': "DEBUG",
+        'added_in_a_later_version': 1,
+        'pdf': {'default_quality': 70, 'new_pdf_option': True},
+        'gui': None,
+    }
+    original = {key: (dict(value) if isinstance(value, dict) else value)
+                for key, value in data.items()}
+
+    settings = manager._dict_to_settings(data)
+
+    assert data == original
+    assert settings.log_level == "DEBUG"
+    assert settings.pdf.default_quality == 70
+    assert settings.gui == settings_manager.GUISettings()
+    assert settings.image == settings_manager.ImageSettings()
+
+
+def test_apply_preset(config_dir):
+    """Test that presets update the global settings like update_settings would."""
+    global_manager = settings_manager.get_settings_manager()
+
+    assert settings_manager.apply_preset('minimal')
+    assert not settings_manager.apply_preset('unknown')
+    global_manager.flush()
+
+    reference = SettingsManager(config_dir=os.path.join(config_dir, "reference"))
+    reference.update_settings(**settings_manager.PRESETS['minimal'])
+    reference.flush()
+
+    reloaded = SettingsManager(config_dir=str(global_manager.config_dir)).get_settings()
+    assert reloaded == reference.get_settings()
+    assert reference.get_settings().gui.show_image_previews is False
+
+
+def test_default_config_dir_is_isolated_per_test(settings_manager_tmp, tmp_path):
+    """Test that the conftest fixture keeps default managers out of the user's home."""
+    assert SettingsManager().config_dir == tmp_path / "config"
+    assert settings_manager.get_settings_manager().config_dir == tmp_path / "config"
+
+
+def test_get_temp_directory_is_created_once(manager, config_dir, monkeypatch):
+    """Test that the temp directory is created on first use and cached until it changes."""
+    first = os.path.join(config_dir, "temp_first")
+    second = os.path.join(config_dir, "temp_second")
+    manager.update_settings(temp_directory=first)
+
+    mkdirs = []
+    real_mkdir = settings_manager.Path.mkdir
+    def counting_mkdir(self, *args, **kwargs):
+        mkdirs.append(str(self))
+        return real_mkdir(self, *args, **kwargs)
+    monkeypatch.setattr(settings_manager.Path, 'mkdir', counting_mkdir)
+
+    assert manager.get_temp_directory() == settings_manager.Path(first)
+    assert manager.get_temp_directory() == settings_manager.Path(first)
+    assert mkdirs == [first]
+
+    manager.update_settings(temp_directory=second)
+    assert manager.get_temp_directory() == settings_manager.Path(second)
+    assert os.path.isdir(second)
+
+    # Cleaning up removes the directory, so the next call recreates it
+    manager.cleanup_temp_directory()
+    assert not os.path.exists(second)
+    assert os.path.isdir(manager.get_temp_directory())
+    manager.flush()